@@ -8,7 +8,7 @@ with iterative refinement, source evaluation, and result synthesis.
 __version__ = "1.0.0"
 
 # Import main API functions for easy access
-from deep_research.api import deep_research, write_final_report, write_chain_of_thought_report
+from deep_research.api import deep_research, write_final_report, write_chain_of_thought_report, write_combined_report
 
 # Export main classes for advanced usage
 from deep_research.engine import ResearchEngine
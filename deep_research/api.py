@@ -9,7 +9,7 @@ import logging
 from typing import Dict, Optional
 
 from .engine import ResearchEngine
-from .reporting import write_chain_of_thought_report, write_final_report
+from .reporting import write_chain_of_thought_report, write_combined_report, write_final_report
 
 logger = logging.getLogger(__name__)
 
@@ -65,4 +65,4 @@ async def deep_research(query: str, breadth: Optional[int] = None, depth: Option
             "chain_of_thought": [f"Critical error in research process: {str(e)}"]
         }
 
-__all__ = ['deep_research', 'write_chain_of_thought_report', 'write_final_report']
\ No newline at end of file
+__all__ = ['deep_research', 'write_chain_of_thought_report', 'write_combined_report', 'write_final_report']
\ No newline at end of file
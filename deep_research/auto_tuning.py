@@ -13,6 +13,16 @@ from typing import Dict, Tuple, List
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import so repeated complexity analyses (every research
+# run, every AutoTuner instance) share the same pattern and keyword table
+_ENTITY_RE = re.compile(
+    r'([A-Z][a-z]+ [A-Z][a-z]+|[A-Z][a-z]+\.[A-Z][a-z]+|[A-Z][A-Z]+|[A-Z][a-z]+)'
+)
+
+_COMPLEXITY_KEYWORDS = ('compare', 'contrast', 'analyze', 'evaluate',
+                        'synthesize', 'implications', 'impact', 'effects',
+                        'trend', 'development', 'causes', 'relationship')
+
 
 class AutoTuner:
     """
@@ -51,18 +61,14 @@ class AutoTuner:
             Dictionary with complexity metrics
         """
         # Count entities, topics and concepts
-        entity_pattern = r'([A-Z][a-z]+ [A-Z][a-z]+|[A-Z][a-z]+\.[A-Z][a-z]+|[A-Z][A-Z]+|[A-Z][a-z]+)'
-        entities = re.findall(entity_pattern, query)
+        entities = _ENTITY_RE.findall(query)
 
         # Count specific question aspects
         aspects = query.count(',') + query.count(';') + query.count('and')
 
         # Count specific keywords that indicate complexity
-        complexity_keywords = ['compare', 'contrast', 'analyze', 'evaluate',
-                               'synthesize', 'implications', 'impact', 'effects',
-                               'trend', 'development', 'causes', 'relationship']
-
-        keyword_count = sum(1 for word in complexity_keywords if word in query.lower())
+        query_lower = query.lower()
+        keyword_count = sum(1 for word in _COMPLEXITY_KEYWORDS if word in query_lower)
 
         # Calculate weighted complexity score
         complexity_score = (len(entities) * 0.5) + (aspects * 0.3) + (keyword_count * 0.7)
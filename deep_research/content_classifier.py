@@ -7,9 +7,39 @@ and numerical reasonableness validation.
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple
 from datetime import datetime
 
+# Patterns are compiled once at import so each check is a sequence of
+# compiled-pattern scans with no per-call re-cache lookups
+_SPECULATIVE_RE = re.compile(
+    r"could be|might be|potentially|possibly|projected|forecasted"
+    r"|expected to|anticipated|estimated|by 20\d\d|in the future",
+    re.IGNORECASE
+)
+
+_OPINION_RE = re.compile(
+    r"believe|feel|think|suggest|indicate|likely|recommend|advocate|argue",
+    re.IGNORECASE
+)
+
+_MONTH_NAMES = r"january|february|march|april|may|june|july|august|september|october|november|december"
+
+_UPCOMING_RE = re.compile(
+    rf"upcoming.{{0,50}}({_MONTH_NAMES}).{{0,10}}(20\d\d)", re.IGNORECASE
+)
+_SCHEDULED_RE = re.compile(
+    rf"scheduled.*?for.*?({_MONTH_NAMES}).*?(20\d\d)", re.IGNORECASE
+)
+
+_MONTH_NUMBERS = {name: i for i, name in enumerate(_MONTH_NAMES.split("|"), start=1)}
+
+_LONG_TERM_PROJECTION_RE = re.compile(
+    r"(by|in|reach|hitting).{0,20}(20[3-9]\d).{0,50}\$?([0-9,]+\.[0-9]+)",
+    re.IGNORECASE
+)
+
 
 class ContentClassifier:
     """
@@ -19,6 +49,10 @@ class ContentClassifier:
     - Classify content as factual, speculative, or opinion
     - Validate temporal consistency of content
     - Assess numerical reasonableness of projections
+
+    The underlying checks are pure functions of (text, current date), so they
+    are memoized at module level; the same content scraped from multiple
+    sources is only ever analyzed once.
     """
 
     def __init__(self, current_date: datetime = None):
@@ -40,28 +74,7 @@ class ContentClassifier:
         Returns:
             Classification as "factual", "speculative", or "opinion"
         """
-        speculative_phrases = [
-            r"(?i)could be", r"(?i)might be", r"(?i)potentially",
-            r"(?i)possibly", r"(?i)projected", r"(?i)forecasted",
-            r"(?i)expected to", r"(?i)anticipated", r"(?i)estimated",
-            r"(?i)by 20\d\d", r"(?i)in the future"
-        ]
-
-        opinion_phrases = [
-            r"(?i)believe", r"(?i)feel", r"(?i)think",
-            r"(?i)suggest", r"(?i)indicate", r"(?i)likely",
-            r"(?i)recommend", r"(?i)advocate", r"(?i)argue"
-        ]
-
-        for phrase in speculative_phrases:
-            if re.search(phrase, text):
-                return "speculative"
-
-        for phrase in opinion_phrases:
-            if re.search(phrase, text):
-                return "opinion"
-
-        return "factual"
+        return _classify_content_type(text)
 
     def validate_temporal_consistency(self, text: str) -> Tuple[bool, str]:
         """
@@ -73,41 +86,7 @@ class ContentClassifier:
         Returns:
             Tuple of (is_valid, message) where is_valid is a boolean and message is an explanation
         """
-        # Extract dates and events with their time frames
-        upcoming_pattern = r"(?i)upcoming.{0,50}(january|february|march|april|may|june|july|august|september|october|november|december).{0,10}(20\d\d)"
-        scheduled_pattern = r"(?i)scheduled.*?for.*?(january|february|march|april|may|june|july|august|september|october|november|december).*?(20\d\d)"
-        date_pattern = r"(?i)(january|february|march|april|may|june|july|august|september|october|november|december).{0,10}(20\d\d)"
-
-        # Check upcoming events
-        upcoming_matches = re.finditer(upcoming_pattern, text)
-        for match in upcoming_matches:
-            month = match.group(1).lower()
-            year = int(match.group(2))
-
-            # Create a datetime object for the event
-            month_num = ["january", "february", "march", "april", "may", "june",
-                         "july", "august", "september", "october", "november", "december"].index(month) + 1
-            event_date = datetime(year, month_num, 1)  # Using day 1 as default
-
-            # Check if the event is actually in the future
-            if event_date < self.current_date:
-                return False, f"Temporal inconsistency: '{match.group(0)}' refers to a past event as upcoming"
-
-        # Check scheduled events
-        scheduled_matches = re.finditer(scheduled_pattern, text)
-        for match in scheduled_matches:
-            month = match.group(1).lower()
-            year = int(match.group(2))
-
-            month_num = ["january", "february", "march", "april", "may", "june",
-                         "july", "august", "september", "october", "november", "december"].index(month) + 1
-            event_date = datetime(year, month_num, 1)  # Using day 1 as default
-
-            # Check if the event is in the past
-            if event_date < self.current_date:
-                return False, f"Temporal inconsistency: '{match.group(0)}' refers to a scheduled event that should have already occurred"
-
-        return True, "No temporal inconsistencies detected"
+        return _validate_temporal_consistency(text, self.current_date.isoformat())
 
     def validate_numerical_reasonableness(self, text: str) -> Tuple[bool, str]:
         """
@@ -119,18 +98,67 @@ class ContentClassifier:
         Returns:
             Tuple of (is_valid, message) where is_valid is a boolean and message is an explanation
         """
-        # Look for very precise long-term projections
-        #long_term_projection_pattern = r"(?i)(by|in|reach|hitting).{0,10}(20[3-9]\d).{0,30}\$?([0-9,]+\.[0-9]+)"
-        long_term_projection_pattern = r"(?i)(by|in|reach|hitting).{0,20}(20[3-9]\d).{0,50}\$?([0-9,]+\.[0-9]+)"
+        return _validate_numerical_reasonableness(text, self.current_date.year)
+
+
+@lru_cache(maxsize=512)
+def _classify_content_type(text: str) -> str:
+    """Memoized implementation of ContentClassifier.classify_content_type."""
+    if _SPECULATIVE_RE.search(text):
+        return "speculative"
+
+    if _OPINION_RE.search(text):
+        return "opinion"
+
+    return "factual"
+
+
+@lru_cache(maxsize=512)
+def _validate_temporal_consistency(text: str, current_date_iso: str) -> Tuple[bool, str]:
+    """Memoized implementation of ContentClassifier.validate_temporal_consistency.
+
+    The classifier's date is passed as an ISO string so the cache key stays
+    hashable and instances sharing a date share cache entries.
+    """
+    current_date = datetime.fromisoformat(current_date_iso)
+
+    # Check upcoming events
+    for match in _UPCOMING_RE.finditer(text):
+        month = match.group(1).lower()
+        year = int(match.group(2))
+
+        # Create a datetime object for the event
+        event_date = datetime(year, _MONTH_NUMBERS[month], 1)  # Using day 1 as default
+
+        # Check if the event is actually in the future
+        if event_date < current_date:
+            return False, f"Temporal inconsistency: '{match.group(0)}' refers to a past event as upcoming"
+
+    # Check scheduled events
+    for match in _SCHEDULED_RE.finditer(text):
+        month = match.group(1).lower()
+        year = int(match.group(2))
+
+        event_date = datetime(year, _MONTH_NUMBERS[month], 1)  # Using day 1 as default
+
+        # Check if the event is in the past
+        if event_date < current_date:
+            return False, f"Temporal inconsistency: '{match.group(0)}' refers to a scheduled event that should have already occurred"
+
+    return True, "No temporal inconsistencies detected"
+
 
-        matches = re.finditer(long_term_projection_pattern, text)
-        for match in matches:
-            year = int(match.group(2))
-            value = match.group(3).replace(',', '')
+@lru_cache(maxsize=512)
+def _validate_numerical_reasonableness(text: str, current_year: int) -> Tuple[bool, str]:
+    """Memoized implementation of ContentClassifier.validate_numerical_reasonableness."""
+    # Look for very precise long-term projections
+    for match in _LONG_TERM_PROJECTION_RE.finditer(text):
+        year = int(match.group(2))
+        value = match.group(3).replace(',', '')
 
-            # Check if the projection is too precise for the time frame
-            years_ahead = year - self.current_date.year
-            if years_ahead > 10 and '.' in value:
-                return False, f"Unreasonable precision: '{match.group(0)}' has decimal precision for a {years_ahead}-year forecast"
+        # Check if the projection is too precise for the time frame
+        years_ahead = year - current_year
+        if years_ahead > 10 and '.' in value:
+            return False, f"Unreasonable precision: '{match.group(0)}' has decimal precision for a {years_ahead}-year forecast"
 
-        return True, "No unreasonable numerical projections detected"
\ No newline at end of file
+    return True, "No unreasonable numerical projections detected"
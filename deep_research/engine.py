@@ -494,8 +494,10 @@ class ResearchEngine:
         Args:
             new_learning: New learning to check for contradictions
         """
-        # Skip if no existing learnings
-        if not self.memory.learnings:
+        # One snapshot for the whole scan; the learnings property copies on
+        # every access
+        existing_learnings = self.memory.learnings
+        if not existing_learnings:
             return
 
         # Keywords that might indicate a similar topic
@@ -505,7 +507,7 @@ class ResearchEngine:
 
         # Check for contradictions on performance
         if any(keyword in new_learning.lower() for keyword in performance_keywords):
-            for existing in self.memory.learnings:
+            for existing in existing_learnings:
                 if any(keyword in existing.lower() for keyword in performance_keywords):
                     # If both talk about performance but with opposite sentiment
                     positive_terms = ["growth", "increase", "positive", "strong", "success"]
@@ -521,7 +523,7 @@ class ResearchEngine:
 
         # Check for contradictions on events/dates
         if any(keyword in new_learning.lower() for keyword in event_keywords):
-            for existing in self.memory.learnings:
+            for existing in existing_learnings:
                 if any(keyword in existing.lower() for keyword in event_keywords):
                     # If both mention dates but they're different
                     date_pattern = r"(january|february|march|april|may|june|july|august|september|october|november|december).{0,10}(20\d\d)"
@@ -533,7 +535,7 @@ class ResearchEngine:
 
         # Check for contradictions on layoffs
         if any(keyword in new_learning.lower() for keyword in layoff_keywords):
-            for existing in self.memory.learnings:
+            for existing in existing_learnings:
                 if any(keyword in existing.lower() for keyword in layoff_keywords):
                     # If one mentions plans and the other mentions it already happened
                     plan_terms = ["plan", "will", "future", "expected", "upcoming"]
@@ -724,8 +726,11 @@ class ResearchEngine:
         return {
             "learnings": self.memory.learnings,
             "visited_urls": self.memory.visited_urls,
-            "chain_of_thought": self.memory.chain_of_thought,
-            "information_map": self.memory.information_map,
+            "chain_of_thought": list(self.memory.chain_of_thought),
+            "information_map": {
+                topic: {info_type: sorted(entries) for info_type, entries in data.items()}
+                for topic, data in self.memory.information_map.items()
+            },
             "contradictions": self.memory.contradictions,
             "source_evaluations": self.memory.source_evaluations
         }
\ No newline at end of file
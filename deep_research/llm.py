@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+import weakref
 import tiktoken
 from litellm import acompletion
 
@@ -13,17 +15,37 @@ try:
 except Exception:
     encoder = tiktoken.get_encoding("cl100k_base")
 
+# Bound the number of in-flight LLM requests so concurrent callers (parallel
+# queries, report generation) pace themselves under provider rate limits
+# instead of triggering throttled retries.
+_LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+
+# Semaphores bind to the event loop they first block on, so a single
+# module-level instance breaks the second asyncio.run() in a process.
+# Keep one per running loop instead; weak keys let closed loops drop out.
+_llm_sems: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _llm_sem() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _llm_sems.get(loop)
+    if sem is None:
+        sem = asyncio.Semaphore(_LLM_MAX_CONCURRENCY)
+        _llm_sems[loop] = sem
+    return sem
+
 async def generate_object(model, system, prompt, schema):
     response = None
     try:
-        response = await acompletion(
-            model=model,
-            response_format=schema,
-            messages=[{"role": "system", "content": system},
-                      {"role": "user", "content": prompt.strip()}],
-            #temperature=self.temperature,
-            #max_tokens=300,
-        )
+        async with _llm_sem():
+            response = await acompletion(
+                model=model,
+                response_format=schema,
+                messages=[{"role": "system", "content": system},
+                          {"role": "user", "content": prompt.strip()}],
+                #temperature=self.temperature,
+                #max_tokens=300,
+            )
         result = response.choices[0].message["content"].strip()
         logger.info(f"LLM response: {result}")
         return result
@@ -32,6 +54,39 @@ async def generate_object(model, system, prompt, schema):
         raise e
 
 
+async def generate_object_stream(model, system, prompt, schema, on_token=None):
+    """
+    Streaming variant of generate_object.
+
+    Tokens are forwarded to the optional on_token callback as they arrive,
+    so callers can surface progress (stdout, partial file writes) instead of
+    waiting for the full response. The complete response text is returned
+    for schema validation by the caller.
+    """
+    try:
+        async with _llm_sem():
+            stream = await acompletion(
+                model=model,
+                response_format=schema,
+                messages=[{"role": "system", "content": system},
+                          {"role": "user", "content": prompt.strip()}],
+                stream=True,
+            )
+            parts = []
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if on_token is not None:
+                        on_token(delta)
+        result = "".join(parts).strip()
+        logger.info(f"LLM response: {result}")
+        return result
+    except Exception as e:
+        logger.error(f"OpenAI API streaming call failed: {e}")
+        raise e
+
+
 def trim_prompt(prompt: str, context_size: int = None) -> str:
     if context_size is None:
         context_size = int(os.environ.get("CONTEXT_SIZE", 128000))
@@ -5,13 +5,49 @@ This module provides functionality for storing and managing research findings,
 including learnings, sources, contradictions, and information maps.
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Any
+import sys
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Any, Optional
 from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .models import SourceEvaluation
+
+try:
+    # Optional (crawl extra): a Bloom filter front-end keeps URL dedup in a
+    # few bits per entry on crawls that visit hundreds of thousands of pages
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
 
 logger = logging.getLogger(__name__)
 
 
+def _canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different spellings dedup to one entry.
+
+    Lowercases the host, strips default ports and fragments, and sorts
+    query parameters.
+    """
+    parts = urlsplit(url)
+    netloc = parts.netloc.lower()
+    if parts.scheme == "http" and netloc.endswith(":80"):
+        netloc = netloc[:-3]
+    elif parts.scheme == "https" and netloc.endswith(":443"):
+        netloc = netloc[:-4]
+    query = urlencode(sorted(parse_qsl(parts.query)))
+    return urlunsplit((parts.scheme, netloc, parts.path, query, ""))
+
+
+def _url_key(canonical_url: str) -> bytes:
+    """Fixed-size 16-byte digest used as the dedup key for a canonical URL."""
+    return hashlib.blake2b(canonical_url.encode(), digest_size=16).digest()
+
+
 class ResearchMemory:
     """
     Store and manage research findings and context throughout the research process.
@@ -26,13 +62,50 @@ class ResearchMemory:
 
     def __init__(self):
         """Initialize an empty research memory."""
-        self.learnings: List[str] = []
-        self.visited_urls: List[str] = []
-        self.chain_of_thought: List[str] = []
-        self.information_map: Dict[str, Dict] = {}  # Track consensus, contradictions, and gaps
+        # dicts with None values double as insertion-ordered sets: O(1)
+        # membership for dedup plus guaranteed iteration order for reports
+        self._learnings: Dict[str, None] = {}
+        # URLs dedup on fixed-size digests of the canonical form, which keeps
+        # the key set compact on crawls that visit thousands of pages
+        self._urls: List[str] = []
+        self._url_keys: set = set()
+        self._url_bloom = (
+            ScalableBloomFilter(initial_capacity=10_000, error_rate=1e-4)
+            if ScalableBloomFilter is not None else None
+        )
+        # Bounded so multi-hour runs cannot grow the reasoning trace without
+        # limit; appends stay O(1) with no realloc copies
+        self.chain_of_thought: Deque[str] = deque(maxlen=10_000)
+        # Track consensus, contradictions, and gaps; sets dedup for free and
+        # defaultdict layers remove per-update setdefault branches
+        self.information_map: Dict[str, Dict] = defaultdict(lambda: defaultdict(set))
         self.contradictions: List[Dict] = []  # Explicitly track contradictions
+        # Topic index over the list above for O(1) per-topic retrieval when
+        # reports group contradictions
+        self._contradictions_by_topic: Dict[str, List[Dict]] = defaultdict(list)
         self.source_evaluations: List[Dict] = []  # Track source evaluations
+        # URL index over the list above: duplicate detection and lookups in
+        # O(1) without copying the evaluation dicts
+        self._eval_by_url: Dict[str, Dict] = {}
         self.current_date = datetime.now()  # Store current date for temporal validation
+        # Formatted timestamp prefix cached per second: thoughts arrive in
+        # bursts and the strftime would otherwise repeat for each one
+        self._ts_second = 0
+        self._ts_prefix = ""
+
+    @property
+    def learnings(self) -> List[str]:
+        """Research learnings in insertion order."""
+        return list(self._learnings)
+
+    @property
+    def visited_urls(self) -> List[str]:
+        """Visited URLs in insertion order, as first seen.
+
+        Returns a copy: the internal list must stay in sync with the dedup
+        key set, so caller mutations cannot be allowed to reach it.
+        """
+        return list(self._urls)
 
     def add_learning(self, learning: str) -> None:
         """
@@ -41,8 +114,10 @@ class ResearchMemory:
         Args:
             learning: New research learning to add
         """
-        if learning not in self.learnings:
-            self.learnings.append(learning)
+        if learning not in self._learnings:
+            # Interning lets repeated learnings across queries share one
+            # string object and compare by identity
+            self._learnings[sys.intern(learning)] = None
             logger.info(f"New learning added: {learning[:100]}...")
 
     def add_learnings(self, new_learnings: List[str]) -> None:
@@ -52,8 +127,7 @@ class ResearchMemory:
         Args:
             new_learnings: List of new learnings to add
         """
-        for learning in new_learnings:
-            self.add_learning(learning)
+        self._learnings.update(dict.fromkeys(map(sys.intern, new_learnings)))
 
     def add_url(self, url: str) -> None:
         """
@@ -62,8 +136,22 @@ class ResearchMemory:
         Args:
             url: URL to add to visited sources
         """
-        if url not in self.visited_urls:
-            self.visited_urls.append(url)
+        # Dedup on the canonical form but store the raw spelling: source
+        # evaluations and report links carry the URL exactly as scraped, and
+        # exact-string joins against them must keep working
+        key = _url_key(_canonicalize_url(url))
+        if self._url_bloom is not None and key not in self._url_bloom:
+            # Definitely unseen: record it without probing the exact set
+            self._url_bloom.add(key)
+            self._url_keys.add(key)
+            self._urls.append(sys.intern(url))
+            return
+        # Probable hit (or no Bloom filter): the exact set decides
+        if key not in self._url_keys:
+            if self._url_bloom is not None:
+                self._url_bloom.add(key)
+            self._url_keys.add(key)
+            self._urls.append(sys.intern(url))
 
     def add_urls(self, new_urls: List[str]) -> None:
         """
@@ -82,8 +170,11 @@ class ResearchMemory:
         Args:
             thought: Reasoning step to add to the chain of thought
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.chain_of_thought.append(f"[{timestamp}] {thought}")
+        second = int(time.time())
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        self.chain_of_thought.append(f"[{self._ts_prefix}] {thought}")
         logger.info(f"Chain of thought: {thought}")
 
     def add_contradiction(self, topic: str, claim1: str, claim2: str, source1: str = "", source2: str = "") -> None:
@@ -106,17 +197,52 @@ class ResearchMemory:
             "timestamp": datetime.now().isoformat()
         }
         self.contradictions.append(contradiction)
+        self._contradictions_by_topic[topic].append(contradiction)
         self.add_thought(f"Contradiction detected in topic '{topic}': {claim1} vs {claim2}")
 
-    def add_source_evaluation(self, evaluation: Dict) -> None:
+    def get_contradictions(self, topic: str) -> List[Dict]:
+        """
+        Return the contradictions recorded for a topic.
+
+        Args:
+            topic: Topic to look up
+
+        Returns:
+            Contradictions for the topic in insertion order, or an empty list
+        """
+        return self._contradictions_by_topic.get(topic, [])
+
+    def add_source_evaluation(self, evaluation: Dict, _trusted: bool = True) -> None:
         """
         Add a source evaluation to the research memory.
 
         Args:
             evaluation: Dictionary containing source evaluation data
+            _trusted: Whether the evaluation was produced by this process and
+                already validated at ingress; pass False for external data to
+                re-run schema validation before storing
         """
+        if not _trusted:
+            evaluation = SourceEvaluation(**evaluation).model_dump()
+        url = evaluation.get("url")
+        if url is not None:
+            # Last-wins: a source re-evaluated in a later iteration replaces
+            # the indexed entry while the full history stays in the list
+            self._eval_by_url[url] = evaluation
         self.source_evaluations.append(evaluation)
 
+    def get_evaluation(self, url: str) -> Optional[Dict]:
+        """
+        Return the stored evaluation for a URL, if any.
+
+        Args:
+            url: URL of the evaluated source
+
+        Returns:
+            The evaluation dict, or None if the URL has not been evaluated
+        """
+        return self._eval_by_url.get(url)
+
     def update_information_map(self, topic: str, info_type: str, content: Any) -> None:
         """
         Update the information map with new content.
@@ -126,11 +252,8 @@ class ResearchMemory:
             info_type: Type of information (consensus, contradictions, gaps)
             content: Content to add to the information map
         """
-        if topic not in self.information_map:
-            self.information_map[topic] = {"consensus": [], "contradictions": [], "gaps": []}
-
-        if info_type in self.information_map[topic]:
-            if isinstance(content, list):
-                self.information_map[topic][info_type].extend(content)
-            else:
-                self.information_map[topic][info_type].append(content)
\ No newline at end of file
+        bucket = self.information_map[topic][info_type]
+        if isinstance(content, list):
+            bucket.update(content)
+        else:
+            bucket.add(content)
\ No newline at end of file
@@ -1,5 +1,10 @@
+import sys
+
+from datetime import datetime
+from enum import Enum
 from typing import List, Dict, Optional, Any, Union
-from pydantic import BaseModel, Field, validator, field_validator
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, validator, field_validator
 
 
 class ChainOfThoughtSummary(BaseModel):
@@ -30,18 +35,58 @@ class Report(BaseModel):
     )
 
 
+class CombinedReport(BaseModel):
+    """Final research report and reasoning summary generated in a single call."""
+    final_report_markdown: str = Field(
+        description="Final report on the topic in Markdown."
+    )
+    chain_of_thought_summary: str = Field(
+        description="Detailed chain-of-thought markdown-formatted summary explaining the reasoning steps."
+    )
+
+
+class Rating(str, Enum):
+    """Credibility or relevance rating of a source.
+
+    One member object per value is shared across all instances, so equality
+    checks short-circuit on identity while string comparison and JSON
+    serialization behave exactly like the raw strings they replace.
+    """
+    HIGH = "high"
+    MEDIUM_HIGH = "medium-high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+    # On 3.11 str()/format() of a str-mixin Enum yields "Rating.HIGH"; keep
+    # interpolation identical to the raw strings (what stdlib StrEnum does)
+    __str__ = str.__str__
+
+
+class Confidence(str, Enum):
+    """Confidence level of an information item."""
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+    __str__ = str.__str__
+
+
 class SourceEvaluation(BaseModel):
     """Evaluation of a research source."""
+    # Value-type leaf created in bulk: frozen makes instances hashable and
+    # safe to share across collections
+    model_config = ConfigDict(frozen=True)
+
     url: str = Field(
         description="URL of the source."
     )
     title: str = Field(
         description="Title of the source."
     )
-    credibility_rating: str = Field(
+    credibility_rating: Rating = Field(
         description="Credibility rating of the source (high, medium-high, medium, low)."
     )
-    relevance_rating: str = Field(
+    relevance_rating: Rating = Field(
         description="Relevance rating of the source (high, medium-high, medium, low)."
     )
     justification: str = Field(
@@ -52,19 +97,13 @@ class SourceEvaluation(BaseModel):
         default_factory=list
     )
 
-    @field_validator('credibility_rating')
-    def validate_credibility_rating(cls, v):
-        valid_ratings = ['high', 'medium-high', 'medium', 'low']
-        if v.lower() not in valid_ratings:
-            raise ValueError(f"Credibility rating must be one of: {', '.join(valid_ratings)}")
-        return v.lower()
-
-    @field_validator('relevance_rating')
-    def validate_relevance_rating(cls, v):
-        valid_ratings = ['high', 'medium-high', 'medium', 'low']
-        if v.lower() not in valid_ratings:
-            raise ValueError(f"Relevance rating must be one of: {', '.join(valid_ratings)}")
-        return v.lower()
+    @field_validator('credibility_rating', 'relevance_rating', mode='before')
+    def normalize_rating(cls, v, info):
+        # Enum lookup does the validation; only case needs normalizing.
+        # Trusted snapshots were normalized when first validated.
+        if info.context and info.context.get("trusted"):
+            return v
+        return v.lower() if isinstance(v, str) else v
 
 
 class SourceEvaluations(BaseModel):
@@ -73,9 +112,20 @@ class SourceEvaluations(BaseModel):
         description="List of source evaluations."
     )
 
+    @classmethod
+    def from_raw(cls, raw: List[Dict]) -> "SourceEvaluations":
+        """Build from raw evaluation dicts, validating the whole batch at once.
+
+        The adapter already validated every element, so the wrapper is
+        assembled with model_construct rather than re-walking the list.
+        """
+        return cls.model_construct(evaluations=_SOURCE_EVAL_LIST.validate_python(raw))
+
 
 class InformationItem(BaseModel):
     """Single piece of information extracted from sources."""
+    model_config = ConfigDict(frozen=True)
+
     content: str = Field(
         description="The information content."
     )
@@ -83,21 +133,29 @@ class InformationItem(BaseModel):
         description="URLs of sources supporting this information.",
         default_factory=list
     )
-    confidence: str = Field(
+    confidence: Confidence = Field(
         description="Confidence level (high, medium, low).",
-        default="medium"
+        default=Confidence.MEDIUM
     )
     tags: List[str] = Field(
         description="Tags categorizing this information.",
         default_factory=list
     )
 
-    @field_validator('confidence')
-    def validate_confidence(cls, v):
-        valid_levels = ['high', 'medium', 'low']
-        if v.lower() not in valid_levels:
-            raise ValueError(f"Confidence must be one of: {', '.join(valid_levels)}")
-        return v.lower()
+    @field_validator('confidence', mode='before')
+    def normalize_confidence(cls, v, info):
+        if info.context and info.context.get("trusted"):
+            return v
+        return v.lower() if isinstance(v, str) else v
+
+    @field_validator('source_urls', 'tags')
+    def intern_strings(cls, v, info):
+        # Source URLs and tags repeat heavily across items; interning shares
+        # one string object per distinct value. Trusted snapshots skip the
+        # per-element pass entirely.
+        if info.context and info.context.get("trusted"):
+            return v
+        return [sys.intern(s) for s in v]
 
 
 class InformationGroup(BaseModel):
@@ -118,6 +176,26 @@ class InformationGroup(BaseModel):
         default_factory=list
     )
 
+    @classmethod
+    def from_raw(cls, raw: Dict) -> "InformationGroup":
+        """Build from a raw group dict, validating each item list as a batch.
+
+        As with SourceEvaluations.from_raw, the adapters carry the
+        validation so the wrapper skips its own pass via model_construct.
+        """
+        return cls.model_construct(
+            topic=str(raw["topic"]),
+            consensus=_INFO_ITEM_LIST.validate_python(raw.get("consensus", [])),
+            contradictions=_INFO_ITEM_LIST.validate_python(raw.get("contradictions", [])),
+            gaps=[str(g) for g in raw.get("gaps", [])]
+        )
+
+
+# Shared adapters so batch validation of item lists runs as a single
+# pydantic-core call instead of one model constructor per element
+_SOURCE_EVAL_LIST = TypeAdapter(List[SourceEvaluation])
+_INFO_ITEM_LIST = TypeAdapter(List[InformationItem])
+
 
 class InformationMap(BaseModel):
     """Map of information groups by topic."""
@@ -157,6 +235,8 @@ class Learnings(BaseModel):
 
 class SerpQuery(BaseModel):
     """Query for a search engine."""
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(
         description="A SERP query designed for context-specific, innovative research."
     )
@@ -236,13 +316,17 @@ class ResearchProgress(BaseModel):
         description="Elapsed time in seconds.",
         default=0.0
     )
-    completion_percentage: float = Field(
-        description="Percentage of completion.",
-        default=0.0
-    )
+
+    @computed_field
+    @cached_property
+    def completion_percentage(self) -> float:
+        """Percentage of completion, derived once per snapshot."""
+        return 100.0 * self.completed_queries / max(self.total_queries, 1)
 
 class ResearchError(BaseModel):
     """Error that occurred during research."""
+    model_config = ConfigDict(frozen=True)
+
     error_type: str = Field(
         description="Type of error."
     )
@@ -261,10 +345,21 @@ class ResearchError(BaseModel):
         description="Resolution or workaround applied.",
         default=None
     )
-    timestamp: str = Field(
-        description="Timestamp when the error occurred."
+    timestamp: int = Field(
+        description="Timestamp when the error occurred, in milliseconds since the epoch."
     )
 
+    @field_validator('timestamp', mode='before')
+    def coerce_timestamp(cls, v, info):
+        # Accept ISO-8601 strings at the boundary but store compact epoch ms
+        # so error logs sort and compare on native ints. Trusted snapshots
+        # already hold ints.
+        if info.context and info.context.get("trusted"):
+            return v
+        if isinstance(v, str):
+            return int(datetime.fromisoformat(v).timestamp() * 1000)
+        return v
+
 
 class ResearchErrorLog(BaseModel):
     """Log of errors that occurred during research."""
@@ -453,6 +453,51 @@ Ensure clarity, precision, and a logical flow throughout the report. Use succinc
         {evaluations_string}
         """
 
+    def get_combined_report_prompt(self, prompt: str, learnings_string: str,
+                                   chain_of_thought_string: str,
+                                   current_date: str = None,
+                                   information_map_string: str = "",
+                                   contradictions_string: str = "",
+                                   evaluations_string: str = "") -> str:
+        """
+        Generate a prompt for producing the final report and the chain-of-thought
+        summary in a single model call.
+
+        Args:
+            prompt: The original research question
+            learnings_string: Formatted learnings from the research
+            chain_of_thought_string: The chain of thought reasoning steps as a string
+            current_date: Current date for temporal context
+            information_map_string: Formatted information map
+            contradictions_string: Formatted contradictions
+            evaluations_string: Formatted source evaluations
+
+        Returns:
+            Formatted prompt for generating both reports at once
+        """
+        report_prompt = self.get_enhanced_report_prompt(
+            prompt=prompt,
+            learnings_string=learnings_string,
+            current_date=current_date,
+            information_map_string=information_map_string,
+            contradictions_string=contradictions_string,
+            evaluations_string=evaluations_string
+        )
+
+        return f"""\
+        {report_prompt}
+
+        ## Additional Output: Chain-of-Thought Summary
+
+        Alongside the final report, produce a chain-of-thought summary of the
+        research process below. Structure it chronologically, highlight key
+        decision points and their rationale, trace how queries evolved, and
+        note any abandoned research paths.
+
+        **Chain-of-Thought:**
+        <chain_of_thought>{chain_of_thought_string}</chain_of_thought>
+        """
+
     def get_follow_up_questions_prompt(self, num_questions: int = 3) -> str:
         """Generate a prompt for creating follow-up questions."""
         return f"""Based on the research findings so far, generate {num_questions} focused follow-up questions that would help:
@@ -541,6 +586,16 @@ def get_prompt(prompt_type: str, **kwargs) -> str:
             contradictions_string=kwargs.get('contradictions_string', ''),
             evaluations_string=kwargs.get('evaluations_string', '')
         )
+    elif prompt_type == "combined_report":
+        return prompt_manager.get_combined_report_prompt(
+            prompt=kwargs.get('prompt', ''),
+            learnings_string=kwargs.get('learnings_string', ''),
+            chain_of_thought_string=kwargs.get('chain_of_thought_string', ''),
+            current_date=kwargs.get('current_date'),
+            information_map_string=kwargs.get('information_map_string', ''),
+            contradictions_string=kwargs.get('contradictions_string', ''),
+            evaluations_string=kwargs.get('evaluations_string', '')
+        )
     elif prompt_type == "follow_up_questions":
         return prompt_manager.get_follow_up_questions_prompt(
             num_questions=kwargs.get('num_questions', 3)
@@ -5,19 +5,138 @@ This module provides functions for generating reports based on research results,
 including chain of thought reports and final comprehensive reports.
 """
 
+import hashlib
+import io
+import json
 import logging
-from typing import Dict, List
+from collections import defaultdict
+from typing import Dict, Iterable, List
 from datetime import datetime
 
-from deep_research.llm import trim_prompt, generate_object
+try:
+    # orjson hashes the memoization key several times faster than stdlib
+    # json on the large nested structures fed to the formatters
+    import orjson
+except ImportError:
+    orjson = None
+
+from deep_research.llm import trim_prompt, generate_object, generate_object_stream
 from deep_research.prompts import system_prompt, get_prompt
 from deep_research.models import (
     Report,
-    ChainOfThoughtSummary
+    ChainOfThoughtSummary,
+    CombinedReport
 )
 
 logger = logging.getLogger(__name__)
 
+# Formatted prompt sections memoized by content digest, so retries and
+# repeated reports over the same research data skip the string rebuild.
+_FORMAT_CACHE_SIZE = 32
+
+# Section order and tag names for the information-map prompt block; the
+# schema is fixed so the renderer loops instead of branching per type
+_INFO_MAP_SECTIONS = ("consensus", "contradictions", "gaps")
+_INFO_MAP_CACHE: Dict[bytes, str] = {}
+_CONTRADICTIONS_CACHE: Dict[bytes, str] = {}
+_EVALUATIONS_CACHE: Dict[bytes, str] = {}
+
+
+def _memoized_format(cache: Dict[bytes, str], data, formatter) -> str:
+    """Return formatter(data), caching the result keyed by a digest of data."""
+    if orjson is not None:
+        payload = orjson.dumps(
+            data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+        )
+    else:
+        payload = json.dumps(data, sort_keys=True, default=str).encode()
+    key = hashlib.blake2b(payload).digest()
+    cached = cache.get(key)
+    if cached is None:
+        cached = formatter(data)
+        if len(cache) >= _FORMAT_CACHE_SIZE:
+            cache.clear()
+        cache[key] = cached
+    return cached
+
+
+def _escape_chain_of_thought(chain_of_thought: List[str]) -> str:
+    """Serialize the reasoning trace for prompt splicing in one native pass.
+
+    JSON-encoding the whole list escapes quotes, newlines, and stray markup
+    in every entry at once, so nothing in the trace can collide with the
+    prompt's surrounding tags.
+    """
+    entries = list(chain_of_thought)
+    if orjson is not None:
+        return orjson.dumps(entries).decode()
+    return json.dumps(entries)
+
+
+def _format_information_map(information_map: Dict) -> str:
+    """Format the information map as a prompt section."""
+    # One flat parts list joined once at the end, instead of growing each
+    # section string with repeated concatenation
+    parts = ["\n**Information Map:**\n"]
+    first = True
+    for topic, data in information_map.items():
+        if not first:
+            parts.append("\n")
+        first = False
+        parts.append(f"<topic>{topic}</topic>\n")
+
+        for info_type in _INFO_MAP_SECTIONS:
+            entries = data.get(info_type)
+            if entries:
+                parts.append(f"<{info_type}>\n")
+                parts.append("\n".join([f"- {item}" for item in entries]))
+                parts.append(f"\n</{info_type}>\n")
+
+    return "".join(parts)
+
+
+def _format_contradictions(contradictions: List[Dict]) -> str:
+    """Format detected contradictions as a prompt section."""
+    contradictions_string = "\n**Detected Contradictions:**\n<contradictions>\n"
+    for i, contradiction in enumerate(contradictions):
+        contradictions_string += f"{i + 1}. Topic: {contradiction.get('topic')}\n"
+        contradictions_string += f"   Claim 1: {contradiction.get('claim1')}\n"
+        contradictions_string += f"   Claim 2: {contradiction.get('claim2')}\n"
+        if contradiction.get('source1') or contradiction.get('source2'):
+            contradictions_string += f"   Sources: {contradiction.get('source1')} vs {contradiction.get('source2')}\n"
+        contradictions_string += "\n"
+    contradictions_string += "</contradictions>\n"
+    return contradictions_string
+
+
+def _format_evaluations(source_evaluations: List[Dict]) -> str:
+    """Format source evaluations as a prompt section."""
+    evaluations_string = "\n**Source Evaluations:**\n<evaluations>\n"
+    # Bucket evaluations by credibility in a single pass
+    credibility_groups = defaultdict(list)
+    for e in source_evaluations:
+        credibility_groups[e.get('credibility_rating')].append(e)
+    high_credibility_sources = credibility_groups.get('high', [])
+    low_credibility_sources = credibility_groups.get('low', [])
+
+    if high_credibility_sources:
+        # Limit to top 3 for brevity; justification may be missing
+        lines = [
+            f"- {e.get('title') or e.get('url')}: {(e.get('justification') or '')[:100]}..."
+            for e in high_credibility_sources[:3]
+        ]
+        evaluations_string += "High Credibility Sources:\n" + "\n".join(lines) + "\n"
+
+    if low_credibility_sources:
+        lines = [
+            f"- {e.get('title') or e.get('url')}: {(e.get('justification') or '')[:100]}..."
+            for e in low_credibility_sources[:3]
+        ]
+        evaluations_string += "\nLow Credibility Sources (used with caution):\n" + "\n".join(lines) + "\n"
+
+    evaluations_string += "</evaluations>\n"
+    return evaluations_string
+
 
 async def write_chain_of_thought_report(chain_of_thought: List[str]) -> str:
     """
@@ -29,7 +148,11 @@ async def write_chain_of_thought_report(chain_of_thought: List[str]) -> str:
     Returns:
         Formatted chain of thought report as a string
     """
-    chain_of_thought_string = "\n".join(chain_of_thought)
+    # Nothing to summarize - skip the LLM round-trip entirely
+    if not chain_of_thought:
+        return "No reasoning steps were recorded during the research process."
+
+    chain_of_thought_string = _escape_chain_of_thought(chain_of_thought)
 
     # Generate prompt using the centralized prompt management
     prompt_text = get_prompt(
@@ -53,8 +176,9 @@ async def write_chain_of_thought_report(chain_of_thought: List[str]) -> str:
         return f"Error generating report: {str(e)}"
 
 
-async def write_final_report(prompt: str, learnings: List[str], information_map: Dict = None,
-                             contradictions: List[Dict] = None, source_evaluations: List[Dict] = None) -> str:
+async def write_final_report(prompt: str, learnings: Iterable[str], information_map: Dict = None,
+                             contradictions: List[Dict] = None, source_evaluations: List[Dict] = None,
+                             on_token=None) -> str:
     """
     Generate the final comprehensive research report with attention to data quality issues.
 
@@ -64,73 +188,41 @@ async def write_final_report(prompt: str, learnings: List[str], information_map:
         information_map: Dictionary mapping topics to consensus, contradictions, and gaps
         contradictions: List of contradiction dictionaries
         source_evaluations: List of source evaluation dictionaries
+        on_token: Optional callback invoked with each raw response token as it
+                  streams in, so callers can show progress instead of waiting
+                  for the full report
 
     Returns:
         Formatted final report as a string
     """
-    # Format learnings for the prompt
-    learnings_string = trim_prompt(
-        "\n".join([f"<learning>\n{learning}\n</learning>" for learning in learnings]), 180000
+    # No learnings means there is nothing for the model to synthesize -
+    # return a stub report instead of paying for an LLM call
+    if not learnings:
+        return f"# {prompt}\n\nNo learnings were gathered during the research process, so no report could be generated."
+
+    # Format learnings for the prompt, writing into one buffer instead of
+    # materializing a tagged copy of every learning before the join
+    buf = io.StringIO()
+    for learning in learnings:
+        buf.write("<learning>\n")
+        buf.write(learning)
+        buf.write("\n</learning>\n")
+    learnings_string = trim_prompt(buf.getvalue()[:-1], 180000)
+
+    # Include information map, contradictions and source evaluations if
+    # available; formatting is memoized so retries reuse the built strings
+    information_map_string = (
+        _memoized_format(_INFO_MAP_CACHE, information_map, _format_information_map)
+        if information_map else ""
+    )
+    contradictions_string = (
+        _memoized_format(_CONTRADICTIONS_CACHE, contradictions, _format_contradictions)
+        if contradictions else ""
+    )
+    evaluations_string = (
+        _memoized_format(_EVALUATIONS_CACHE, source_evaluations, _format_evaluations)
+        if source_evaluations else ""
     )
-
-    # Include information map if available
-    information_map_string = ""
-    if information_map:
-        map_sections = []
-        for topic, data in information_map.items():
-            section = f"<topic>{topic}</topic>\n"
-
-            if data.get("consensus"):
-                section += "<consensus>\n"
-                section += "\n".join([f"- {item}" for item in data["consensus"]])
-                section += "\n</consensus>\n"
-
-            if data.get("contradictions"):
-                section += "<contradictions>\n"
-                section += "\n".join([f"- {item}" for item in data["contradictions"]])
-                section += "\n</contradictions>\n"
-
-            if data.get("gaps"):
-                section += "<gaps>\n"
-                section += "\n".join([f"- {item}" for item in data["gaps"]])
-                section += "\n</gaps>\n"
-
-            map_sections.append(section)
-
-        information_map_string = "\n**Information Map:**\n" + "\n".join(map_sections)
-
-    # Include contradictions if available
-    contradictions_string = ""
-    if contradictions:
-        contradictions_string = "\n**Detected Contradictions:**\n<contradictions>\n"
-        for i, contradiction in enumerate(contradictions):
-            contradictions_string += f"{i + 1}. Topic: {contradiction.get('topic')}\n"
-            contradictions_string += f"   Claim 1: {contradiction.get('claim1')}\n"
-            contradictions_string += f"   Claim 2: {contradiction.get('claim2')}\n"
-            if contradiction.get('source1') or contradiction.get('source2'):
-                contradictions_string += f"   Sources: {contradiction.get('source1')} vs {contradiction.get('source2')}\n"
-            contradictions_string += "\n"
-        contradictions_string += "</contradictions>\n"
-
-    # Include source evaluations if available
-    evaluations_string = ""
-    if source_evaluations:
-        evaluations_string = "\n**Source Evaluations:**\n<evaluations>\n"
-        high_credibility_sources = [e for e in source_evaluations if e.get('credibility_rating') == 'high']
-        medium_credibility_sources = [e for e in source_evaluations if e.get('credibility_rating') == 'medium']
-        low_credibility_sources = [e for e in source_evaluations if e.get('credibility_rating') == 'low']
-
-        if high_credibility_sources:
-            evaluations_string += "High Credibility Sources:\n"
-            for e in high_credibility_sources[:3]:  # Limit to top 3 for brevity
-                evaluations_string += f"- {e.get('title') or e.get('url')}: {e.get('justification')[:100]}...\n"
-
-        if low_credibility_sources:
-            evaluations_string += "\nLow Credibility Sources (used with caution):\n"
-            for e in low_credibility_sources[:3]:  # Limit to top 3 for brevity
-                evaluations_string += f"- {e.get('title') or e.get('url')}: {e.get('justification')[:100]}...\n"
-
-        evaluations_string += "</evaluations>\n"
 
     current_date = datetime.now().strftime("%Y-%m-%d")
 
@@ -145,17 +237,83 @@ async def write_final_report(prompt: str, learnings: List[str], information_map:
         evaluations_string=evaluations_string
     )
 
+    try:
+        if on_token is not None:
+            # Stream tokens to the caller as they arrive; schema validation
+            # still happens on the assembled response below.
+            res = await generate_object_stream(
+                model="o3-mini",
+                system=system_prompt(),
+                prompt=prompt_text,
+                schema=Report,
+                on_token=on_token,
+            )
+        else:
+            res = await generate_object(
+                model="o3-mini",
+                system=system_prompt(),
+                prompt=prompt_text,
+                schema=Report,
+            )
+
+        report = Report.model_validate_json(res)
+        return report.markdown
+
+    except Exception as e:
+        logger.error(f"Error generating final report: {str(e)}")
+        return f"Error generating report: {str(e)}"
+
+
+async def write_combined_report(prompt: str, learnings: List[str],
+                                chain_of_thought: List[str]) -> tuple:
+    """
+    Generate the final report and the chain-of-thought summary in one LLM call.
+
+    Both reports operate on the same session data, so asking the model for a
+    combined schema saves a full provider round-trip compared to generating
+    them separately.
+
+    Args:
+        prompt: The original research question or topic
+        learnings: List of research learnings
+        chain_of_thought: List of reasoning steps from the research process
+
+    Returns:
+        Tuple of (final report markdown, chain of thought summary)
+    """
+    if not learnings and not chain_of_thought:
+        return (
+            f"# {prompt}\n\nNo learnings were gathered during the research process, so no report could be generated.",
+            "No reasoning steps were recorded during the research process."
+        )
+
+    learnings_string = trim_prompt(
+        "\n".join([f"<learning>\n{learning}\n</learning>" for learning in learnings]), 180000
+    )
+    chain_of_thought_string = _escape_chain_of_thought(chain_of_thought)
+
+    current_date = datetime.now().strftime("%Y-%m-%d")
+
+    # Generate prompt using the centralized prompt management
+    prompt_text = get_prompt(
+        prompt_type="combined_report",
+        prompt=prompt,
+        learnings_string=learnings_string,
+        chain_of_thought_string=chain_of_thought_string,
+        current_date=current_date
+    )
+
     try:
         res = await generate_object(
             model="o3-mini",
             system=system_prompt(),
             prompt=prompt_text,
-            schema=Report,
+            schema=CombinedReport,
         )
 
-        report = Report.model_validate_json(res)
-        return report.markdown
+        report = CombinedReport.model_validate_json(res)
+        return report.final_report_markdown, report.chain_of_thought_summary
 
     except Exception as e:
-        logger.error(f"Error generating final report: {str(e)}")
-        return f"Error generating report: {str(e)}"
\ No newline at end of file
+        logger.error(f"Error generating combined report: {str(e)}")
+        return f"Error generating report: {str(e)}", f"Error generating report: {str(e)}"
\ No newline at end of file
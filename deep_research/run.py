@@ -2,13 +2,20 @@ import asyncio
 import argparse
 import json
 import logging
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
+from pydantic import BaseModel
 load_dotenv()
 from deep_research.utils.logger import set_logger
-from deep_research import deep_research, write_final_report, write_chain_of_thought_report
+from deep_research import deep_research, write_final_report, write_chain_of_thought_report, write_combined_report
 
 
 # Configure logging
@@ -16,13 +23,18 @@ from deep_research import deep_research, write_final_report, write_chain_of_thou
 set_logger(level=logging.INFO, log_to_file=True, log_file_path="research.log")
 logger = logging.getLogger(__name__)
 
+# Chain-of-thought entries look like "[<timestamp>] <content>"
+_TUNING_ENTRY_RE = re.compile(r'^\[([^\]]+)\]\s+(.*)$', re.DOTALL)
+_TUNING_TAGS = ("Auto-tuned parameters", "Auto-adjusted parameters")
+
 
 class ResearchSession:
     """Manage a complete research session with reporting and output files."""
 
     def __init__(self, query: str, breadth: Optional[int] = None, depth: Optional[int] = None,
                  auto_tune: bool = False, max_depth: int = 5, max_breadth: int = 8,
-                 time_budget_seconds: Optional[int] = None, output_dir: str = "research_output"):
+                 time_budget_seconds: Optional[int] = None, output_dir: str = "research_output",
+                 combine_reports: bool = False):
         """
         Initialize a research session.
 
@@ -35,6 +47,8 @@ class ResearchSession:
             max_breadth: Maximum allowed research breadth when auto-tuning
             time_budget_seconds: Optional time budget in seconds for auto-tuning
             output_dir: Directory to save research output
+            combine_reports: Whether to generate the final report and chain of
+                             thought summary with a single LLM call
         """
         self.query = query
         self.breadth = breadth
@@ -43,6 +57,7 @@ class ResearchSession:
         self.max_depth = max_depth
         self.max_breadth = max_breadth
         self.time_budget_seconds = time_budget_seconds
+        self.combine_reports = combine_reports
 
         self.start_time = datetime.now()
         self.output_dir = Path(output_dir)
@@ -98,19 +113,28 @@ class ResearchSession:
             # Save raw research data
             self.save_raw_data(research_result)
 
-            # Generate final report
-            logger.info("Writing final report...")
-            final_report = await write_final_report(
-                prompt=self.query,
-                learnings=learnings,
-                information_map=information_map,
-                contradictions=contradictions,
-                source_evaluations=source_evaluations
-            )
-
-            # Generate chain of thought report
-            logger.info("Writing chain of thought report...")
-            cot_report = await write_chain_of_thought_report(chain_of_thought=chain_of_thought)
+            if self.combine_reports:
+                # Single LLM call producing both reports
+                logger.info("Writing combined final and chain of thought report...")
+                final_report, cot_report = await write_combined_report(
+                    prompt=self.query,
+                    learnings=learnings,
+                    chain_of_thought=chain_of_thought
+                )
+            else:
+                # Generate final report
+                logger.info("Writing final report...")
+                final_report = await write_final_report(
+                    prompt=self.query,
+                    learnings=learnings,
+                    information_map=information_map,
+                    contradictions=contradictions,
+                    source_evaluations=source_evaluations
+                )
+
+                # Generate chain of thought report
+                logger.info("Writing chain of thought report...")
+                cot_report = await write_chain_of_thought_report(chain_of_thought=chain_of_thought)
 
             # Generate sources section
             sources_section = self.format_sources_section(visited_urls, source_evaluations)
@@ -154,8 +178,19 @@ class ResearchSession:
         """Save raw research data to JSON file."""
         try:
             raw_data_path = self.session_dir / "raw_research_data.json"
-            with open(raw_data_path, 'w') as f:
-                json.dump(research_result, f, indent=2)
+            if isinstance(research_result, BaseModel):
+                # Typed snapshots (e.g. ResearchResult) serialize through
+                # pydantic-core's Rust path without building a dict tree first
+                raw_data_path.write_bytes(research_result.model_dump_json(indent=2).encode())
+            elif orjson is not None:
+                # orjson serializes large result dicts several times faster
+                # than the stdlib and writes bytes directly
+                raw_data_path.write_bytes(
+                    orjson.dumps(research_result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                with open(raw_data_path, 'w') as f:
+                    json.dump(research_result, f, indent=2)
             logger.info(f"Raw research data saved to {raw_data_path}")
         except Exception as e:
             logger.error(f"Error saving raw research data: {str(e)}")
@@ -164,36 +199,17 @@ class ResearchSession:
                      data_quality_section: str, auto_tuning_section: str = ""):
         """Save all generated reports to files."""
         try:
-            # Save final report
-            final_report_path = self.session_dir / "final_report.md"
-            with open(final_report_path, 'w') as f:
-                f.write(final_report)
-            logger.info(f"Final report saved to {final_report_path}")
-
-            # Save chain of thought report
-            cot_report_path = self.session_dir / "chain_of_thought_report.md"
-            with open(cot_report_path, 'w') as f:
-                f.write(cot_report)
-            logger.info(f"Chain of thought report saved to {cot_report_path}")
-
-            # Save sources section
-            sources_path = self.session_dir / "sources.md"
-            with open(sources_path, 'w') as f:
-                f.write(sources_section)
-            logger.info(f"Sources section saved to {sources_path}")
-
-            # Save data quality issues
-            quality_path = self.session_dir / "data_quality_issues.md"
-            with open(quality_path, 'w') as f:
-                f.write(data_quality_section)
-            logger.info(f"Data quality issues saved to {quality_path}")
+            # Map each output file to its content and write them in one loop
+            files = {
+                self.session_dir / "final_report.md": final_report,
+                self.session_dir / "chain_of_thought_report.md": cot_report,
+                self.session_dir / "sources.md": sources_section,
+                self.session_dir / "data_quality_issues.md": data_quality_section,
+            }
 
             # Save auto-tuning decisions if available
             if auto_tuning_section:
-                tuning_path = self.session_dir / "auto_tuning_decisions.md"
-                with open(tuning_path, 'w') as f:
-                    f.write(auto_tuning_section)
-                logger.info(f"Auto-tuning decisions saved to {tuning_path}")
+                files[self.session_dir / "auto_tuning_decisions.md"] = auto_tuning_section
 
             # Create combined report
             combined_report = f"""# Research Report: {self.query}
@@ -216,10 +232,11 @@ class ResearchSession:
 
 {cot_report}
 """
-            combined_path = self.session_dir / "combined_report.md"
-            with open(combined_path, 'w') as f:
-                f.write(combined_report)
-            logger.info(f"Combined report saved to {combined_path}")
+            files[self.session_dir / "combined_report.md"] = combined_report
+
+            for path, content in files.items():
+                path.write_text(content, encoding='utf-8')
+                logger.info(f"Report saved to {path}")
 
         except Exception as e:
             logger.error(f"Error saving reports: {str(e)}")
@@ -333,28 +350,23 @@ These quality considerations have been incorporated into the analysis and recomm
         Returns:
             Formatted markdown string with auto-tuning decisions
         """
-        # Extract auto-tuning decisions from chain of thought
-        auto_tuning_entries = []
+        # Filter and format auto-tuning decisions in a single pass
+        formatted_entries = []
         for entry in chain_of_thought:
-            if "Auto-tuned parameters" in entry or "Auto-adjusted parameters" in entry:
-                auto_tuning_entries.append(entry)
+            if any(tag in entry for tag in _TUNING_TAGS):
+                match = _TUNING_ENTRY_RE.match(entry)
+                if match:
+                    formatted_entries.append(f"- **{match.group(1)}**: {match.group(2)}\n")
+                else:
+                    formatted_entries.append(f"- {entry}\n")
 
-        if not auto_tuning_entries:
+        if not formatted_entries:
             return ""
 
         # Format the auto-tuning section
         tuning_text = "## Auto-Tuning Decisions\n\n"
         tuning_text += "The research process used automatic parameter tuning based on question complexity and information quality:\n\n"
-
-        for entry in auto_tuning_entries:
-            # Clean up the entry timestamp and format
-            parts = entry.split("] ", 1)
-            if len(parts) > 1:
-                timestamp = parts[0].strip("[]")
-                content = parts[1]
-                tuning_text += f"- **{timestamp}**: {content}\n"
-            else:
-                tuning_text += f"- {entry}\n"
+        tuning_text += "".join(formatted_entries)
 
         # Add explanation
         tuning_text += """
@@ -3,17 +3,35 @@
 # libraries
 import os
 from typing import Any
+from urllib.parse import urlparse
 
 import requests
 import json
 import logging
 
+# Hosts whose results should be skipped (video content is not scrapable)
+_BLOCKED_HOSTS = frozenset({"youtube.com", "youtu.be"})
+
+
+def _is_blocked_host(netloc: str) -> bool:
+    """True for the blocked hosts and any of their subdomains."""
+    return netloc in _BLOCKED_HOSTS or netloc.endswith((".youtube.com", ".youtu.be"))
+
 
 class BingSearch:
     """
     Bing Search Retriever
     """
 
+    # Request defaults shared by every search call; only "q" and "count" vary.
+    _BASE_PARAMS = {
+        "responseFilter": "Webpages",
+        "setLang": "en-GB",
+        "textDecorations": False,
+        "textFormat": "HTML",
+        "safeSearch": "Strict"
+    }
+
     def __init__(self, query):
         """
         Initializes the BingSearch object
@@ -22,6 +40,10 @@ class BingSearch:
         """
         self.query = query
         self.api_key = self.get_api_key()
+        self._headers = {
+            'Ocp-Apim-Subscription-Key': self.api_key,
+            'Content-Type': 'application/json'
+        }
         self.logger = logging.getLogger(__name__)
 
     def get_api_key(self):
@@ -49,23 +71,11 @@ class BingSearch:
         # Search the query
         url = "https://api.bing.microsoft.com/v7.0/search"
 
-        headers = {
-            'Ocp-Apim-Subscription-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
-        params = {
-            "responseFilter": "Webpages",
-            "q": self.query,
-            "count": max_results,
-            "setLang": "en-GB",
-            "textDecorations": False,
-            "textFormat": "HTML",
-            "safeSearch": "Strict"
-        }
+        params = {**self._BASE_PARAMS, "q": self.query, "count": max_results}
 
         try:
 
-            resp = requests.get(url, headers=headers, params=params)
+            resp = requests.get(url, headers=self._headers, params=params)
 
 
             if resp is None:
@@ -84,18 +94,14 @@ class BingSearch:
             self.logger.warning(f"No search results found for query: {self.query}")
             return []
 
-        search_results = []
-
-        # Normalize the results to match the format of the other search APIs
-        for result in results:
-            # skip youtube results
-            if "youtube.com" in result["url"]:
-                continue
-            search_result = {
+        # Normalize the results to match the format of the other search APIs,
+        # skipping youtube results
+        return [
+            {
                 "title": result["name"],
                 "href": result["url"],
                 "body": result["snippet"],
             }
-            search_results.append(search_result)
-
-        return search_results
+            for result in results
+            if not _is_blocked_host(urlparse(result["url"]).netloc.lower())
+        ]
@@ -1,16 +1,224 @@
 # logger.py
 
+import atexit
 import logging
+import queue
 import sys
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from logging import handlers
 
-try:
-    # Optional: colorlog for color-coded console logs
-    import colorlog
-    USE_COLORLOG = True
-except ImportError:
-    USE_COLORLOG = False
+# How often (seconds) buffered file handlers are flushed in the background
+_FLUSH_INTERVAL = 30.0
+
+# Listener thread that drains log records to the real handlers, keeping
+# emit() in the application (and asyncio) threads an O(1) queue put
+_queue_listener = None
+
+
+def _stop_queue_listener():
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        # Tear down the downstream handlers too: close() flushes and releases
+        # the file descriptor, and a cancelled flush timer cannot linger into
+        # the next configuration
+        for handler in _queue_listener.handlers:
+            _cancel_flush(handler)
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+class _PassthroughQueueHandler(handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener-side handlers.
+
+    The stock prepare() formats the record before enqueueing, which would
+    make the real handlers format it a second time. The queue never leaves
+    this process, so the record can be passed through untouched.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class FastFormatter(logging.Formatter):
+    """
+    Formatter that caches the formatted timestamp for the current second.
+
+    Under heavy logging most records land in the same wall-clock second, so
+    the strftime call is skipped for all but the first record of each second.
+    Milliseconds (when the date format asks for them) are still taken from
+    the individual record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = None
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            ct = self.converter(record.created)
+            if datefmt:
+                s = time.strftime(datefmt, ct)
+            else:
+                s = time.strftime(self.default_time_format, ct)
+            self._last_sec = sec
+            self._last_str = s
+        s = self._last_str
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
+        return s
+
+
+class AmortizedRotatingFileHandler(handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler tuned for high log volume.
+
+    The stock handler performs a seek+tell on the stream for every record and
+    flushes after each write. This subclass instead:
+
+    - checks the rollover size only once every _CHECK_INTERVAL records, at
+      the price of the file overshooting maxBytes by at most one interval's
+      worth of records;
+    - writes through a 64 KB buffer and flushes immediately only for
+      ERROR/CRITICAL records, leaving routine records to the periodic
+      background flush (see _schedule_flush);
+    - performs the backup rename shuffle on a background thread during
+      rollover, so the emitting thread never stalls on filesystem work.
+    """
+
+    _CHECK_INTERVAL = 1024
+    _BUFFER_SIZE = 65536
+
+    # Single worker so concurrent rollovers serialize in submission order
+    _roll_executor = ThreadPoolExecutor(max_workers=1)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._emit_count = 0
+        self._roll_seq = 0
+
+    def shouldRollover(self, record):
+        self._emit_count += 1
+        if self._emit_count % self._CHECK_INTERVAL:
+            return False
+        return super().shouldRollover(record)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode,
+                    buffering=self._BUFFER_SIZE, encoding=self.encoding)
+
+    def doRollover(self):
+        # Move the full file aside under a unique spill name and reopen the
+        # log immediately; the backup shuffle happens off-thread so emit
+        # latency stays flat through a rollover.
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        spill = None
+        if self.backupCount > 0 and os.path.exists(self.baseFilename):
+            self._roll_seq += 1
+            spill = f"{self.baseFilename}.rolling.{self._roll_seq}"
+            os.replace(self.baseFilename, spill)
+        if not self.delay:
+            self.stream = self._open()
+        if spill:
+            self._roll_executor.submit(self._shift_backups, spill)
+
+    def _shift_backups(self, spill):
+        """Rotate backup files and slot the spilled log in as backup .1."""
+        try:
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = self.rotation_filename("%s.%d" % (self.baseFilename, i))
+                dfn = self.rotation_filename("%s.%d" % (self.baseFilename, i + 1))
+                if os.path.exists(sfn):
+                    if os.path.exists(dfn):
+                        os.remove(dfn)
+                    os.replace(sfn, dfn)
+            dfn = self.rotation_filename(self.baseFilename + ".1")
+            if os.path.exists(dfn):
+                os.remove(dfn)
+            os.replace(spill, dfn)
+        except OSError:
+            # Rotation is best-effort; losing a backup must not take down
+            # the logging pipeline
+            pass
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            # Errors must hit the disk right away; everything else waits for
+            # the buffer or the periodic flush
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _schedule_flush(handler):
+    """Flush the handler every _FLUSH_INTERVAL seconds on a daemon timer.
+
+    The pending timer is kept on the handler so _cancel_flush can stop it
+    when the logger is reconfigured. The exit flush is covered by the
+    atexit-registered _stop_queue_listener, which closes the handler.
+    """
+
+    def _flush():
+        stream = handler.stream
+        if stream is None or stream.closed:
+            # Handler was closed (e.g. logger reconfigured) - stop rescheduling
+            return
+        handler.flush()
+        timer = threading.Timer(_FLUSH_INTERVAL, _flush)
+        timer.daemon = True
+        handler._flush_timer = timer
+        timer.start()
+
+    timer = threading.Timer(_FLUSH_INTERVAL, _flush)
+    timer.daemon = True
+    handler._flush_timer = timer
+    timer.start()
+
+
+def _cancel_flush(handler):
+    """Cancel the handler's pending _schedule_flush timer, if any."""
+    timer = getattr(handler, "_flush_timer", None)
+    if timer is not None:
+        timer.cancel()
+
+
+# Colored formatter class, built lazily so colorlog is only imported when
+# console output is actually a terminal. False means colorlog is missing.
+_colored_formatter_cls = None
+
+
+def _get_colored_formatter_cls():
+    global _colored_formatter_cls
+    if _colored_formatter_cls is None:
+        try:
+            # Optional: colorlog for color-coded console logs
+            import colorlog
+        except ImportError:
+            _colored_formatter_cls = False
+        else:
+            class FastColoredFormatter(FastFormatter, colorlog.ColoredFormatter):
+                """ColoredFormatter with the cached-timestamp fast path."""
+
+            _colored_formatter_cls = FastColoredFormatter
+    return _colored_formatter_cls or None
 
 def set_logger(
     level: int = logging.DEBUG,
@@ -30,6 +238,17 @@ def set_logger(
     :return: A configured logging.Logger instance.
     """
 
+    # ----------------------------------------------------------------------------
+    # IDEMPOTENCE
+    # ----------------------------------------------------------------------------
+    # set_logger may run more than once (examples, tests, reloads); drop any
+    # previously attached root handlers so each record is only ever emitted
+    # once per destination.
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
     # ----------------------------------------------------------------------------
     # FORMATTER
     # ----------------------------------------------------------------------------
@@ -38,21 +257,25 @@ def set_logger(
     date_format = "%Y-%m-%d %H:%M:%S"
     handlers_list = []
 
-    # If colorlog is installed, apply color formatting to console logs
-    if USE_COLORLOG:
-        formatter = colorlog.ColoredFormatter(
-            fmt="%(log_color)s" + log_format,
-            datefmt=date_format,
-            log_colors={
-                "DEBUG": "cyan",
-                "INFO": "green",
-                "WARNING": "yellow",
-                "ERROR": "red",
-                "CRITICAL": "bold_red",
-            },
-        )
-    else:
-        formatter = logging.Formatter(fmt=log_format, datefmt=date_format)
+    # Color the console logs only when colorlog is installed and stdout is a
+    # terminal; ANSI codes are wasted bytes in piped or redirected output
+    formatter = None
+    if sys.stdout.isatty():
+        colored_cls = _get_colored_formatter_cls()
+        if colored_cls is not None:
+            formatter = colored_cls(
+                fmt="%(log_color)s" + log_format,
+                datefmt=date_format,
+                log_colors={
+                    "DEBUG": "cyan",
+                    "INFO": "green",
+                    "WARNING": "yellow",
+                    "ERROR": "red",
+                    "CRITICAL": "bold_red",
+                },
+            )
+    if formatter is None:
+        formatter = FastFormatter(fmt=log_format, datefmt=date_format)
 
     # ----------------------------------------------------------------------------
     # CONSOLE HANDLER
@@ -66,9 +289,9 @@ def set_logger(
     # FILE HANDLER (optional)
     # ----------------------------------------------------------------------------
     if log_to_file:
-        file_formatter = logging.Formatter(fmt=log_format, datefmt=date_format)
+        file_formatter = FastFormatter(fmt=log_format, datefmt=date_format)
         # Create a rotating file handler to automatically rotate logs when they get large
-        file_handler = handlers.RotatingFileHandler(
+        file_handler = AmortizedRotatingFileHandler(
             filename=log_file_path,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -76,9 +299,28 @@ def set_logger(
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(file_formatter)
+        _schedule_flush(file_handler)
         handlers_list.append(file_handler)
 
-    logging.basicConfig(level=level, format=log_format, datefmt=date_format,handlers=handlers_list)
+    # ----------------------------------------------------------------------------
+    # QUEUE LISTENER
+    # ----------------------------------------------------------------------------
+    # The real handlers run on a listener thread; the application threads
+    # (including the asyncio event loop) only pay for an O(1) enqueue per
+    # record instead of blocking on console/disk I/O.
+    global _queue_listener
+    _stop_queue_listener()
+    log_queue = queue.SimpleQueue()
+    _queue_listener = handlers.QueueListener(
+        log_queue, *handlers_list, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    # Attach the queue handler directly; basicConfig is a no-op once the
+    # root logger has handlers and would also add an implicit stderr
+    # StreamHandler on first use
+    root.setLevel(level)
+    root.addHandler(_PassthroughQueueHandler(log_queue))
 
 
 # ---------------------------------------------------------------------
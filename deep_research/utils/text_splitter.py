@@ -1,4 +1,11 @@
+import logging
+import re
 from abc import ABC, abstractmethod
+from collections import deque
+from functools import lru_cache
+from itertools import chain
+
+logger = logging.getLogger(__name__)
 
 
 class TextSplitter(ABC):
@@ -12,12 +19,15 @@ class TextSplitter(ABC):
     def split_text(self, text: str) -> list:
         pass
 
-    def create_documents(self, texts: list) -> list:
-        documents = []
+    def iter_documents(self, texts: list):
+        """Yield chunks lazily so callers can consume them in streaming batches."""
         for text in texts:
-            for chunk in self.split_text(text):
-                documents.append(chunk)
-        return documents
+            yield from self.split_text(text)
+
+    def create_documents(self, texts: list) -> list:
+        # Fuse the per-text chunk lists into a single output list without
+        # materializing intermediates twice
+        return list(chain.from_iterable(map(self.split_text, texts)))
 
     def split_documents(self, documents: list) -> list:
         return self.create_documents(documents)
@@ -27,26 +37,45 @@ class TextSplitter(ABC):
         return text if text else None
 
     def merge_splits(self, splits: list, separator: str) -> list:
-        docs = []
-        current_doc = []
+        # deque gives O(1) evictions from the front of the overlap window;
+        # split lengths are computed once and carried in a parallel deque so
+        # evictions never re-measure the strings
+        current_doc = deque()
+        current_lens = deque()
         total = 0
-        for d in splits:
-            _len = len(d)
+        lens = [len(d) for d in splits]
+        # Pre-size the output from the summed lengths so the list never
+        # reallocates while chunks are emitted
+        est = max(1, sum(lens) // max(self.chunk_size - self.chunk_overlap, 1) + 1)
+        docs = [None] * est
+        k = 0
+        for d, _len in zip(splits, lens):
             if total + _len >= self.chunk_size:
-                if total > self.chunk_size:
-                    print(f"Warning: Created a chunk of size {total}, which is longer than the specified {self.chunk_size}")
+                if total > self.chunk_size and logger.isEnabledFor(logging.WARNING):
+                    logger.warning("Created a chunk of size %d, which is longer than the specified %d",
+                                   total, self.chunk_size)
                 if current_doc:
                     doc = self._join_docs(current_doc, separator)
                     if doc is not None:
-                        docs.append(doc)
+                        if k < est:
+                            docs[k] = doc
+                        else:
+                            docs.append(doc)
+                        k += 1
                     while current_doc and (total > self.chunk_overlap or (total + _len > self.chunk_size and total > 0)):
-                        total -= len(current_doc[0])
-                        current_doc.pop(0)
+                        total -= current_lens.popleft()
+                        current_doc.popleft()
             current_doc.append(d)
+            current_lens.append(_len)
             total += _len
         doc = self._join_docs(current_doc, separator)
         if doc is not None:
-            docs.append(doc)
+            if k < est:
+                docs[k] = doc
+            else:
+                docs.append(doc)
+            k += 1
+        del docs[k:]
         return docs
 
 
@@ -54,33 +83,213 @@ class RecursiveCharacterTextSplitter(TextSplitter):
     def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200, separators: list = None):
         super().__init__(chunk_size, chunk_overlap)
         self.separators = separators if separators is not None else ['\n\n', '\n', '.', ',', '>', '<', ' ', '']
+        # One alternation regex locates the earliest occurrence of any
+        # (non-empty) separator in a single scan; priority ties are then
+        # resolved with at most a few targeted find() calls. Separators
+        # listed after an empty-string entry are unreachable, matching the
+        # old first-match loop.
+        try:
+            empty_idx = self.separators.index("")
+        except ValueError:
+            empty_idx = len(self.separators)
+        self._active_separators = tuple(self.separators[:empty_idx])
+        self._has_empty_separator = empty_idx < len(self.separators)
+        self._sep_re = (
+            re.compile("|".join(re.escape(s) for s in self._active_separators))
+            if self._active_separators else None
+        )
+        self._sep_priority = {s: i for i, s in enumerate(self._active_separators)}
+        self._sep_lens = {s: len(s) for s in self._active_separators}
+        self._fallback_separator = self.separators[-1]
+
+    def _split_spans(self, text: str, start: int, end: int) -> tuple:
+        """
+        Pick the highest-priority separator present in text[start:end] and
+        return the resulting parts as (start, end) spans into the original
+        string, so no substring copies are made while descending. For the
+        empty-string separator the spans are None - the caller chunks the
+        region directly with _char_window_chunks instead.
+        """
+        m = self._sep_re.search(text, start, end) if self._sep_re else None
+        if m is None:
+            # No non-empty separator occurs in the region
+            if self._has_empty_separator:
+                return None, ""
+            return [(start, end)], self._fallback_separator
+
+        # m is the earliest occurrence of any separator; a higher-priority
+        # one can only occur at or after that position
+        sep = m.group()
+        priority = self._sep_priority[sep]
+        if priority:
+            for candidate in self._active_separators[:priority]:
+                if text.find(candidate, m.start(), end) != -1:
+                    sep = candidate
+                    break
+
+        spans = []
+        sep_len = self._sep_lens[sep]
+        pos = start
+        idx = text.find(sep, m.start(), end)
+        while idx != -1:
+            spans.append((pos, idx))
+            pos = idx + sep_len
+            idx = text.find(sep, pos, end)
+        spans.append((pos, end))
+        return spans, sep
+
+    def _char_window_chunks(self, text: str) -> list:
+        """
+        Chunk separator-less text with sliding-window slices.
+
+        Equivalent to running merge_splits over single-character splits -
+        windows of chunk_size - 1 characters advancing by
+        chunk_size - 1 - chunk_overlap - without allocating one string per
+        character.
+        """
+        window = self.chunk_size - 1
+        n = len(text)
+        if n <= window:
+            doc = text.strip()
+            return [doc] if doc else []
+        step = window - self.chunk_overlap
+        if step <= 0:
+            # chunk_overlap == chunk_size - 1: the merge loop cannot evict
+            # below the overlap, so after the initial window it emits
+            # full-size windows advancing one character at a time
+            docs = []
+            doc = text[:window].strip()
+            if doc:
+                docs.append(doc)
+            for i in range(n - self.chunk_size + 1):
+                doc = text[i:i + self.chunk_size].strip()
+                if doc:
+                    docs.append(doc)
+            return docs
+        docs = []
+        i = 0
+        while i + window < n:
+            doc = text[i:i + window].strip()
+            if doc:
+                docs.append(doc)
+            i += step
+        doc = text[i:].strip()
+        if doc:
+            docs.append(doc)
+        return docs
+
+    def _merge_spans(self, text: str, spans: list) -> list:
+        """
+        Merge consecutive under-size spans into chunks.
+
+        Consecutive spans from one split are separated in the original text
+        by exactly their separator, so a merged chunk is the single slice
+        text[first_start:last_end] - equivalent to separator.join of the
+        parts but without materializing them. Window accounting matches
+        merge_splits: lengths exclude the separators.
+        """
+        # Pre-size the output from the summed span lengths so the list never
+        # reallocates while chunks are emitted
+        sum_lens = sum(e - s for s, e in spans)
+        est = max(1, sum_lens // max(self.chunk_size - self.chunk_overlap, 1) + 1)
+        docs = [None] * est
+        k = 0
+        current = deque()
+        total = 0
+        for span in spans:
+            _len = span[1] - span[0]
+            if total + _len >= self.chunk_size:
+                if total > self.chunk_size and logger.isEnabledFor(logging.WARNING):
+                    logger.warning("Created a chunk of size %d, which is longer than the specified %d",
+                                   total, self.chunk_size)
+                if current:
+                    doc = text[current[0][0]:current[-1][1]].strip()
+                    if doc:
+                        if k < est:
+                            docs[k] = doc
+                        else:
+                            docs.append(doc)
+                        k += 1
+                    while current and (total > self.chunk_overlap or (total + _len > self.chunk_size and total > 0)):
+                        first = current.popleft()
+                        total -= first[1] - first[0]
+            current.append(span)
+            total += _len
+        if current:
+            doc = text[current[0][0]:current[-1][1]].strip()
+            if doc:
+                if k < est:
+                    docs[k] = doc
+                else:
+                    docs.append(doc)
+                k += 1
+        del docs[k:]
+        return docs
 
     def split_text(self, text: str) -> list:
         final_chunks = []
-        # Choose an appropriate separator.
-        separator = self.separators[-1]
-        for s in self.separators:
-            if s == "":
-                separator = s
-                break
-            if s in text:
-                separator = s
-                break
-
-        # Split the text.
-        splits = text.split(separator) if separator != "" else list(text)
-        good_splits = []
-        for s in splits:
-            if len(s) < self.chunk_size:
-                good_splits.append(s)
-            else:
-                if good_splits:
-                    merged = self.merge_splits(good_splits, separator)
+        # Explicit frame stack instead of recursion, operating on (start,
+        # end) spans of the original text: each frame holds the spans being
+        # consumed, the resume index and the under-size spans accumulated
+        # for the next merge. Substrings are only materialized when a chunk
+        # is emitted, keeping memory traffic at O(chunks) instead of
+        # O(depth x text length).
+        spans, separator = self._split_spans(text, 0, len(text))
+        if separator == "":
+            return self._char_window_chunks(text)
+        stack = [[spans, 0, []]]
+        while stack:
+            frame = stack[-1]
+            spans, i, good_spans = frame
+            descended = False
+            while i < len(spans):
+                span = spans[i]
+                i += 1
+                if span[1] - span[0] < self.chunk_size:
+                    good_spans.append(span)
+                else:
+                    if good_spans:
+                        merged = self._merge_spans(text, good_spans)
+                        final_chunks.extend(merged)
+                        good_spans = frame[2] = []
+                    sub_spans, sub_separator = self._split_spans(text, span[0], span[1])
+                    if sub_separator == "" or len(sub_spans) == 1:
+                        # No separators left (or none configured for this
+                        # region): slice it directly and carry on in this
+                        # frame rather than descending forever
+                        final_chunks.extend(self._char_window_chunks(text[span[0]:span[1]]))
+                        continue
+                    # Remember where to resume, then descend into the
+                    # oversize span
+                    frame[1] = i
+                    stack.append([sub_spans, 0, []])
+                    descended = True
+                    break
+            if not descended:
+                if good_spans:
+                    merged = self._merge_spans(text, good_spans)
                     final_chunks.extend(merged)
-                    good_splits = []
-                other_info = self.split_text(s)
-                final_chunks.extend(other_info)
-        if good_splits:
-            merged = self.merge_splits(good_splits, separator)
-            final_chunks.extend(merged)
+                stack.pop()
         return final_chunks
+
+    def create_documents(self, texts: list) -> list:
+        # Scraped pages often share identical boilerplate (navigation,
+        # footers), so memoize whole-text splits for the duration of this
+        # batch. The cache is cleared afterwards to bound memory.
+        separators = tuple(self.separators)
+        try:
+            return list(chain.from_iterable(
+                _split_text_cached(text, separators, self.chunk_size, self.chunk_overlap)
+                for text in texts
+            ))
+        finally:
+            _split_text_cached.cache_clear()
+
+
+@lru_cache(maxsize=2048)
+def _split_text_cached(text: str, separators: tuple, chunk_size: int, chunk_overlap: int) -> tuple:
+    """Split text with a throwaway splitter, memoized on the full inputs."""
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size, chunk_overlap=chunk_overlap, separators=list(separators)
+    )
+    return tuple(splitter.split_text(text))
@@ -0,0 +1,25 @@
+"""
+Shared structural types for test assertions.
+"""
+
+from typing import Dict, List, TypedDict
+
+
+class ResearchResult(TypedDict):
+    """Shape of the dict returned by ResearchEngine.deep_research."""
+    learnings: List[str]
+    visited_urls: List[str]
+    chain_of_thought: List[str]
+    information_map: Dict
+    contradictions: List
+    source_evaluations: List
+
+
+def assert_research_result(result) -> None:
+    """Assert that a result structurally matches ResearchResult.
+
+    One subset check against the TypedDict's required keys replaces the
+    per-key membership asserts scattered through the suite.
+    """
+    assert isinstance(result, dict)
+    assert ResearchResult.__required_keys__ <= result.keys()
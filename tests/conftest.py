@@ -11,6 +11,16 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+try:
+    # orjson serializes mock payloads noticeably faster across the suite's
+    # thousands of mocked LLM calls
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
 
 # Add path to the packages
 import sys
@@ -28,6 +38,7 @@ def mock_env_vars():
         "TAVILY_API_KEY": "mock-tavily-key",
         "BING_API_KEY": "mock-bing-key",
         "FIRECRAWL_API_URL": "http://localhost:3002",
+        "LLM_MODEL_NAME": "gpt-4o",
         "CONTEXT_SIZE": "16000",
         "DEFAULT_DEPTH": "3",
         "DEFAULT_BREADTH": "4",
@@ -39,6 +50,17 @@ def mock_env_vars():
         yield
 
 
+@pytest.fixture(autouse=True)
+def _fast_sleep(monkeypatch):
+    """Collapse asyncio.sleep waits so no test blocks on real wall-clock time."""
+    real_sleep = asyncio.sleep
+
+    def fast_sleep(delay, *args, **kwargs):
+        return real_sleep(min(delay, 0.01), *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "sleep", fast_sleep)
+
+
 # Mock data fixtures
 @pytest.fixture
 def sample_query() -> str:
@@ -46,7 +68,7 @@ def sample_query() -> str:
     return "Analyze the recent developments in quantum computing hardware"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_learnings() -> List[str]:
     """Sample research learnings."""
     return [
@@ -58,7 +80,7 @@ def sample_learnings() -> List[str]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_urls() -> List[str]:
     """Sample research URLs."""
     return [
@@ -130,7 +152,7 @@ def mock_search_results() -> Dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_scraped_content() -> Dict:
     """Mock scraped content from URLs."""
     return {
@@ -158,74 +180,81 @@ class MockLLMResponse:
     """Mock response from LLM API."""
 
     def __init__(self, content):
-        self.choices = [MagicMock(message={"content": json.dumps(content)})]
-
+        self.choices = [MagicMock(message={"content": _dumps(content)})]
+
+
+# Canned responses serialized once at import; callers only read the content
+# string, so the same instance is safe to hand out for every call
+_CANNED_RESPONSES = {
+    Learnings.__name__: MockLLMResponse({
+        "learnings": [
+            "IBM unveiled a 1,121-qubit 'Condor' processor.",
+            "Google's Quantum AI team announced a 70-qubit 'Bristlecone' processor."
+        ],
+        "follow_up_questions": [
+            "What error correction methods are being used?",
+            "How do different quantum hardware approaches compare?"
+        ]
+    }),
+    ChainOfThoughtSummary.__name__: MockLLMResponse({
+        "summary": "The research process began by analyzing the quantum computing landscape..."
+    }),
+    SourceEvaluations.__name__: MockLLMResponse({
+        "evaluations": [
+            {
+                "url": "https://research.ibm.com/blog/1000-qubit-processor",
+                "title": "IBM Quantum Computing",
+                "credibility_rating": "high",
+                "relevance_rating": "high",
+                "justification": "Official company research blog",
+                "key_points": ["1,121-qubit processor", "December 2023 release"]
+            }
+        ]
+    }),
+    SerpQueries.__name__: MockLLMResponse({
+        "queries": [
+            {
+                "query": "recent quantum computing hardware advancements IBM Google",
+                "research_goal": "Identify latest quantum processor developments"
+            },
+            {
+                "query": "quantum error correction surface codes recent progress",
+                "research_goal": "Understand error correction approaches"
+            }
+        ]
+    }),
+}
+
+_DEFAULT_RESPONSE = MockLLMResponse({
+    "markdown": (
+        "# Quantum Computing Hardware Report\n\n"
+        "This report summarizes recent developments...\n\n"
+        "- IBM unveiled the 1,121-qubit Condor processor\n"
+        "- Google continues its quantum supremacy experiments"
+    )
+})
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_client():
     """Mock for LLM client."""
+    # acompletion is async, so patch installs an AsyncMock; a synchronous
+    # side effect's return value becomes the awaited result directly, which
+    # skips the extra dispatch coroutine per mocked call
     with patch('deep_research.llm.acompletion') as mock:
-        # Configure the mock to return a specific response
-        async def mock_acompletion(*args, **kwargs):
-            # Different responses based on the schema parameter
+        def mock_acompletion(*args, **kwargs):
             schema = kwargs.get('response_format', None)
-            prompt = kwargs.get('messages', [{}])[-1].get('content', '')
-
-            if schema.__name__ == Learnings.__name__ :
-                return MockLLMResponse({
-                    "learnings": [
-                        "IBM unveiled a 1,121-qubit 'Condor' processor.",
-                        "Google's Quantum AI team announced a 70-qubit 'Bristlecone' processor."
-                    ],
-                    "follow_up_questions": [
-                        "What error correction methods are being used?",
-                        "How do different quantum hardware approaches compare?"
-                    ]
-                })
-            elif schema.__name__ == ChainOfThoughtSummary.__name__ :
-                return MockLLMResponse({
-                    "summary": "The research process began by analyzing the quantum computing landscape..."
-                })
-            elif schema.__name__ == SourceEvaluations.__name__ :
-                return MockLLMResponse({
-                    "evaluations": [
-                        {
-                            "url": "https://research.ibm.com/blog/1000-qubit-processor",
-                            "title": "IBM Quantum Computing",
-                            "credibility_rating": "high",
-                            "relevance_rating": "high",
-                            "justification": "Official company research blog",
-                            "key_points": ["1,121-qubit processor", "December 2023 release"]
-                        }
-                    ]
-                })
-            elif schema.__name__ == SerpQueries.__name__:
-                return MockLLMResponse({
-                    "queries": [
-                        {
-                            "query": "recent quantum computing hardware advancements IBM Google",
-                            "research_goal": "Identify latest quantum processor developments"
-                        },
-                        {
-                            "query": "quantum error correction surface codes recent progress",
-                            "research_goal": "Understand error correction approaches"
-                        }
-                    ]
-                })
-            else:
-                return MockLLMResponse({
-                    "markdown": "# Quantum Computing Hardware Report\n\nThis report summarizes recent developments..."
-                })
+            return _CANNED_RESPONSES.get(schema.__name__, _DEFAULT_RESPONSE)
 
         mock.side_effect = mock_acompletion
         yield mock
 
 
 # Mock for search engine
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_search_engine():
     """Mock for search engine."""
-    with patch('deep_research.search_engines.tavily.tavily_search.TavilySearch') as mock:
+    # Patch the name the engine module bound at import time
+    with patch('deep_research.engine.TavilySearch') as mock:
         instance = mock.return_value
 
         async def mock_search(*args, **kwargs):
@@ -247,7 +276,7 @@ def mock_search_engine():
 
 
 # Mock for firecrawl
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_firecrawl():
     """Mock for firecrawl."""
     with patch('deep_research.engine.firecrawl') as mock:
@@ -272,10 +301,15 @@ def mock_firecrawl():
         yield mock
 
 
-# Event loop fixture for asyncio tests
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for each test case."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
\ No newline at end of file
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_llm_client, mock_search_engine, mock_firecrawl):
+    """Reset call records on the session-scoped mocks between tests.
+
+    Configured return values and side effects are kept, so tests still see
+    the canned responses while call assertions stay independent.
+    """
+    yield
+    for mock in (mock_llm_client, mock_search_engine, mock_firecrawl):
+        mock.reset_mock(return_value=False, side_effect=False)
+
+
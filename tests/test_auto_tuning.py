@@ -5,141 +5,128 @@ Tests for the auto_tuning module.
 import pytest
 from unittest.mock import patch, MagicMock
 import asyncio
+import operator
+from types import SimpleNamespace
 
 from deep_research.auto_tuning import AutoTuner
 
 
-class TestAutoTuner:
-    """Tests for the AutoTuner class."""
-
-    @pytest.fixture
-    def auto_tuner(self):
-        """Return an AutoTuner instance for testing."""
-        return AutoTuner(max_depth=5, max_breadth=8, time_budget_seconds=300)
-
-    @pytest.mark.asyncio
-    async def test_analyze_question_complexity_simple(self, auto_tuner):
-        """Test analyzing a simple question."""
-        query = "What is quantum computing?"
-
-        result = await auto_tuner.analyze_question_complexity(query)
-
-        assert isinstance(result, dict)
-        assert "complexity_score" in result
-        assert 0 <= result["complexity_score"] <= 1
-        assert result["complexity_score"] < 0.5  # Simple question should have low score
-
-    @pytest.mark.asyncio
-    async def test_analyze_question_complexity_complex(self, auto_tuner):
-        """Test analyzing a complex question."""
-        query = "Compare and contrast the quantum computing approaches of IBM, Google, and Microsoft, and analyze the implications for the development of quantum error correction techniques and their impact on the future of computational chemistry."
-
-        result = await auto_tuner.analyze_question_complexity(query)
-
-        assert isinstance(result, dict)
-        assert "complexity_score" in result
-        assert 0 <= result["complexity_score"] <= 1
-        assert result["complexity_score"] > 0.5  # Complex question should have high score
-        assert result["entity_count"] >= 3  # Should detect IBM, Google, Microsoft
-
-    def test_determine_initial_parameters(self, auto_tuner):
-        """Test determining initial parameters."""
-        # Test with low complexity
-        complexity_metrics = {"complexity_score": 0.2, "entity_count": 1, "aspect_count": 1,
-                              "complexity_keyword_count": 0}
-        depth, breadth = auto_tuner.determine_initial_parameters(complexity_metrics)
-
-        assert 1 <= depth <= 5
-        assert 2 <= breadth <= 8
-        assert depth < auto_tuner.max_depth  # Should be less than max for low complexity
-
-        # Test with high complexity
-        complexity_metrics = {"complexity_score": 0.9, "entity_count": 5, "aspect_count": 4,
-                              "complexity_keyword_count": 6}
-        depth, breadth = auto_tuner.determine_initial_parameters(complexity_metrics)
-
-        assert 1 <= depth <= 5
-        assert 2 <= breadth <= 8
-        assert depth == auto_tuner.max_depth or depth == auto_tuner.max_depth - 1  # Should be near max for high complexity
-
-    def test_adjust_parameters_low_quality(self, auto_tuner):
-        """Test parameter adjustment with low info quality."""
-        current_depth = 3
-        current_breadth = 4
-        info_quality = 0.2  # Low quality
-        time_usage_fraction = 0.4  # Not running out of time
-
-        new_depth, new_breadth = auto_tuner.adjust_parameters(
-            current_depth, current_breadth, info_quality, time_usage_fraction
-        )
-
-        # With low quality, should increase search (unless already at max)
-        assert new_depth >= current_depth or new_depth == auto_tuner.max_depth
-        assert new_breadth > current_breadth or new_breadth == auto_tuner.max_breadth
-
-    def test_adjust_parameters_high_quality(self, auto_tuner):
-        """Test parameter adjustment with high info quality."""
-        current_depth = 3
-        current_breadth = 4
-        info_quality = 0.8  # High quality
-        time_usage_fraction = 0.4  # Not running out of time
-
-        new_depth, new_breadth = auto_tuner.adjust_parameters(
-            current_depth, current_breadth, info_quality, time_usage_fraction
-        )
-
-        # With high quality, could potentially reduce search
-        assert new_depth <= current_depth or new_depth == 1  # Don't go below 1
-        assert new_breadth <= current_breadth or new_breadth == 2  # Don't go below 2
-
-    def test_adjust_parameters_time_constraint(self, auto_tuner):
-        """Test parameter adjustment with time constraint."""
-        current_depth = 3
-        current_breadth = 4
-        info_quality = 0.5  # Medium quality
-        time_usage_fraction = 0.8  # Running out of time
-
-        new_depth, new_breadth = auto_tuner.adjust_parameters(
-            current_depth, current_breadth, info_quality, time_usage_fraction
-        )
-
-        # Running out of time should reduce parameters
-        assert new_depth < current_depth or new_depth == 1
-        assert new_breadth < current_breadth or new_breadth == 2
-
-    def test_estimate_info_quality(self, auto_tuner, sample_learnings):
-        """Test estimating information quality."""
-        # Test with good learnings and no contradictions
-        quality = auto_tuner.estimate_info_quality(sample_learnings, [])
-        assert 0 <= quality <= 1
-        assert quality > 0.5  # Good learnings should have high quality
-
-        # Test with contradictions
-        contradictions = [
-            {"topic": "Test", "claim1": "A", "claim2": "B"},
-            {"topic": "Test2", "claim1": "X", "claim2": "Y"}
-        ]
-        quality_with_contradictions = auto_tuner.estimate_info_quality(sample_learnings, contradictions)
-        assert quality_with_contradictions < quality  # Contradictions should lower quality
-
-    def test_get_time_usage_fraction(self, auto_tuner):
-        """Test getting time usage fraction."""
-        # Test with no time budget
-        auto_tuner.time_budget_seconds = None
-        assert auto_tuner.get_time_usage_fraction() == 0.0
-
-        # Test with time budget but no start time
-        auto_tuner.time_budget_seconds = 300
-        auto_tuner.start_time = None
-        assert auto_tuner.get_time_usage_fraction() == 0.0
-
-        # Test with time budget and start time
-        auto_tuner.time_budget_seconds = 300
-        # Mock the event loop time
-        with patch('asyncio.get_event_loop') as mock_loop:
-            mock_time = MagicMock()
-            mock_loop.return_value.time.return_value = 150  # 150 seconds elapsed
-            auto_tuner.start_time = 0  # Started at 0
-
-            fraction = auto_tuner.get_time_usage_fraction()
-            assert fraction == 0.5  # 150/300 = 0.5
\ No newline at end of file
+@pytest.fixture(scope="session")
+def auto_tuner():
+    """Return an AutoTuner instance shared across the session."""
+    return AutoTuner(max_depth=5, max_breadth=8, time_budget_seconds=300)
+
+
+async def test_analyze_question_complexity_simple(auto_tuner):
+    """Test analyzing a simple question."""
+    query = "What is quantum computing?"
+
+    result = await auto_tuner.analyze_question_complexity(query)
+
+    assert isinstance(result, dict)
+    assert "complexity_score" in result
+    assert 0 <= result["complexity_score"] <= 1
+    assert result["complexity_score"] < 0.5  # Simple question should have low score
+
+
+async def test_analyze_question_complexity_complex(auto_tuner):
+    """Test analyzing a complex question."""
+    query = "Compare and contrast the quantum computing approaches of IBM, Google, and Microsoft, and analyze the implications for the development of quantum error correction techniques and their impact on the future of computational chemistry."
+
+    result = await auto_tuner.analyze_question_complexity(query)
+
+    assert isinstance(result, dict)
+    assert "complexity_score" in result
+    assert 0 <= result["complexity_score"] <= 1
+    assert result["complexity_score"] > 0.5  # Complex question should have high score
+    assert result["entity_count"] >= 3  # Should detect IBM, Google, Microsoft
+
+
+def test_determine_initial_parameters(auto_tuner):
+    """Test determining initial parameters."""
+    # Test with low complexity
+    complexity_metrics = {"complexity_score": 0.2, "entity_count": 1, "aspect_count": 1,
+                          "complexity_keyword_count": 0}
+    depth, breadth = auto_tuner.determine_initial_parameters(complexity_metrics)
+
+    assert 1 <= depth <= 5
+    assert 2 <= breadth <= 8
+    assert depth < auto_tuner.max_depth  # Should be less than max for low complexity
+
+    # Test with high complexity
+    complexity_metrics = {"complexity_score": 0.9, "entity_count": 5, "aspect_count": 4,
+                          "complexity_keyword_count": 6}
+    depth, breadth = auto_tuner.determine_initial_parameters(complexity_metrics)
+
+    assert 1 <= depth <= 5
+    assert 2 <= breadth <= 8
+    assert depth == auto_tuner.max_depth or depth == auto_tuner.max_depth - 1  # Should be near max for high complexity
+
+
+@pytest.mark.parametrize("info_quality,time_usage_fraction,depth_cmp,depth_limit,breadth_cmp,breadth_limit", [
+    # With low quality and time to spare, should increase search
+    # (unless already at max)
+    (0.2, 0.4, operator.ge, "max_depth", operator.gt, "max_breadth"),
+    # With high quality, could potentially reduce search
+    # (don't go below 1 / 2)
+    (0.8, 0.4, operator.le, 1, operator.le, 2),
+    # Running out of time should reduce parameters
+    (0.5, 0.8, operator.lt, 1, operator.lt, 2),
+])
+def test_adjust_parameters(auto_tuner, info_quality, time_usage_fraction,
+                           depth_cmp, depth_limit, breadth_cmp, breadth_limit):
+    """Test parameter adjustment across quality and time-budget regimes."""
+    current_depth = 3
+    current_breadth = 4
+
+    new_depth, new_breadth = auto_tuner.adjust_parameters(
+        current_depth, current_breadth, info_quality, time_usage_fraction
+    )
+
+    # String limits name an attribute bound on the tuner (max_depth/max_breadth)
+    if isinstance(depth_limit, str):
+        depth_limit = getattr(auto_tuner, depth_limit)
+    if isinstance(breadth_limit, str):
+        breadth_limit = getattr(auto_tuner, breadth_limit)
+
+    assert depth_cmp(new_depth, current_depth) or new_depth == depth_limit
+    assert breadth_cmp(new_breadth, current_breadth) or new_breadth == breadth_limit
+
+
+def test_estimate_info_quality(auto_tuner, sample_learnings):
+    """Test estimating information quality."""
+    # Test with good learnings and no contradictions
+    quality = auto_tuner.estimate_info_quality(sample_learnings, [])
+    assert 0 <= quality <= 1
+    assert quality > 0.5  # Good learnings should have high quality
+
+    # Test with contradictions
+    contradictions = [
+        {"topic": "Test", "claim1": "A", "claim2": "B"},
+        {"topic": "Test2", "claim1": "X", "claim2": "Y"}
+    ]
+    quality_with_contradictions = auto_tuner.estimate_info_quality(sample_learnings, contradictions)
+    assert quality_with_contradictions < quality  # Contradictions should lower quality
+
+
+def test_get_time_usage_fraction(auto_tuner, monkeypatch):
+    """Test getting time usage fraction."""
+    # monkeypatch restores the shared tuner's attributes after the test
+    # Test with no time budget
+    monkeypatch.setattr(auto_tuner, "time_budget_seconds", None)
+    assert auto_tuner.get_time_usage_fraction() == 0.0
+
+    # Test with time budget but no start time
+    monkeypatch.setattr(auto_tuner, "time_budget_seconds", 300)
+    monkeypatch.setattr(auto_tuner, "start_time", None)
+    assert auto_tuner.get_time_usage_fraction() == 0.0
+
+    # Test with time budget and start time
+    # Fake the event loop clock with a plain namespace; cheaper than
+    # routing every attribute lookup through MagicMock
+    monkeypatch.setattr(asyncio, "get_event_loop",
+                        lambda: SimpleNamespace(time=lambda: 150))  # 150 seconds elapsed
+    monkeypatch.setattr(auto_tuner, "start_time", 0)  # Started at 0
+
+    fraction = auto_tuner.get_time_usage_fraction()
+    assert fraction == 0.5  # 150/300 = 0.5
\ No newline at end of file
@@ -75,6 +75,12 @@ class TestResearchMemory:
         assert len(memory.visited_urls) == 2
         assert url2 in memory.visited_urls
 
+        # Trivial respellings dedup against the canonical form, but the
+        # first-seen raw spelling is what stays stored
+        memory.add_url("https://Research.IBM.com/blog/1000-qubit-processor#intro")
+        assert len(memory.visited_urls) == 2
+        assert url in memory.visited_urls
+
     def test_add_urls(self, memory):
         """Test adding multiple URLs to memory."""
         urls = [
@@ -168,6 +174,14 @@ class TestResearchMemory:
         assert len(memory.source_evaluations) == 2
         assert memory.source_evaluations[1] == evaluation2
 
+        # Re-evaluating a URL appends to the history and the by-URL lookup
+        # returns the newest entry
+        reevaluation = dict(evaluation, relevance_rating="medium")
+        memory.add_source_evaluation(reevaluation)
+        assert len(memory.source_evaluations) == 3
+        assert memory.source_evaluations[2] == reevaluation
+        assert memory.get_evaluation(evaluation["url"]) == reevaluation
+
     def test_update_information_map(self, memory):
         """Test updating the information map."""
         # Test adding consensus information
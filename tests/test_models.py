@@ -3,6 +3,7 @@ Tests for the models module.
 """
 
 import pytest
+from datetime import datetime
 from pydantic import ValidationError
 
 from deep_research.models import (
@@ -26,6 +27,32 @@ from deep_research.models import (
 )
 
 
+# Module-scoped samples: the leaf models are frozen, so read-only tests can
+# share one instance instead of re-running validation per test
+@pytest.fixture(scope="module")
+def ibm_evaluation():
+    """Canonical valid source evaluation."""
+    return SourceEvaluation(
+        url="https://research.ibm.com/blog/1000-qubit-processor",
+        title="IBM Unveils 1,000+ Qubit Quantum Processor",
+        credibility_rating="high",
+        relevance_rating="high",
+        justification="Official IBM research blog with technical details",
+        key_points=["1,121-qubit Condor processor", "December 2023 release"]
+    )
+
+
+@pytest.fixture(scope="module")
+def condor_item():
+    """Canonical valid information item."""
+    return InformationItem(
+        content="IBM unveiled a 1,121-qubit 'Condor' processor in December 2023.",
+        source_urls=["https://research.ibm.com/blog/1000-qubit-processor"],
+        confidence="high",
+        tags=["IBM", "hardware", "quantum processor"]
+    )
+
+
 class TestModels:
     """Tests for the Pydantic models."""
 
@@ -73,50 +100,34 @@ class TestModels:
         with pytest.raises(ValidationError):
             Report()
 
-    def test_source_evaluation(self):
+    def test_source_evaluation(self, ibm_evaluation):
         """Test SourceEvaluation model."""
         # Valid instance
-        eval = SourceEvaluation(
-            url="https://research.ibm.com/blog/1000-qubit-processor",
-            title="IBM Unveils 1,000+ Qubit Quantum Processor",
-            credibility_rating="high",
-            relevance_rating="high",
-            justification="Official IBM research blog with technical details",
-            key_points=["1,121-qubit Condor processor", "December 2023 release"]
-        )
-        assert eval.url == "https://research.ibm.com/blog/1000-qubit-processor"
-        assert eval.credibility_rating == "high"
-        assert len(eval.key_points) == 2
-
-        # Invalid credibility rating
+        assert ibm_evaluation.url == "https://research.ibm.com/blog/1000-qubit-processor"
+        assert ibm_evaluation.credibility_rating == "high"
+        assert len(ibm_evaluation.key_points) == 2
+
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param(
+            {"url": "https://example.com", "title": "Example",
+             "credibility_rating": "super-high", "relevance_rating": "high",
+             "justification": "Example justification"},
+            id="invalid-credibility-rating"),
+        pytest.param(
+            {"url": "https://example.com", "title": "Example",
+             "credibility_rating": "high", "relevance_rating": "super-high",
+             "justification": "Example justification"},
+            id="invalid-relevance-rating"),
+        pytest.param(
+            {"url": "https://example.com", "title": "Example",
+             "relevance_rating": "high",
+             "justification": "Example justification"},
+            id="missing-credibility-rating"),
+    ])
+    def test_source_evaluation_invalid(self, kwargs):
+        """Test SourceEvaluation rejection of invalid input."""
         with pytest.raises(ValidationError):
-            SourceEvaluation(
-                url="https://example.com",
-                title="Example",
-                credibility_rating="super-high",  # Invalid value
-                relevance_rating="high",
-                justification="Example justification"
-            )
-
-        # Invalid relevance rating
-        with pytest.raises(ValidationError):
-            SourceEvaluation(
-                url="https://example.com",
-                title="Example",
-                credibility_rating="high",
-                relevance_rating="super-high",  # Invalid value
-                justification="Example justification"
-            )
-
-        # Missing required fields
-        with pytest.raises(ValidationError):
-            SourceEvaluation(
-                url="https://example.com",
-                title="Example",
-                # Missing credibility_rating
-                relevance_rating="high",
-                justification="Example justification"
-            )
+            SourceEvaluation(**kwargs)
 
     def test_source_evaluations(self):
         """Test SourceEvaluations model."""
@@ -150,19 +161,33 @@ class TestModels:
         with pytest.raises(ValidationError):
             SourceEvaluations()
 
-    def test_information_item(self):
+    def test_source_evaluations_from_raw(self):
+        """Test batch construction of SourceEvaluations from raw dicts."""
+        raw = [
+            {
+                "url": "https://research.ibm.com/blog/1000-qubit-processor",
+                "title": "IBM Quantum",
+                "credibility_rating": "HIGH",  # Normalized like field input
+                "relevance_rating": "high",
+                "justification": "Official IBM research blog"
+            }
+        ]
+
+        evals = SourceEvaluations.from_raw(raw)
+        assert evals == SourceEvaluations(evaluations=raw)
+        assert evals.evaluations[0].credibility_rating == "high"
+
+        # Element validation still runs on the batch path
+        with pytest.raises(ValidationError):
+            SourceEvaluations.from_raw([{"url": "https://example.com"}])
+
+    def test_information_item(self, condor_item):
         """Test InformationItem model."""
         # Valid instance with all fields
-        item = InformationItem(
-            content="IBM unveiled a 1,121-qubit 'Condor' processor in December 2023.",
-            source_urls=["https://research.ibm.com/blog/1000-qubit-processor"],
-            confidence="high",
-            tags=["IBM", "hardware", "quantum processor"]
-        )
-        assert item.content.startswith("IBM unveiled")
-        assert item.confidence == "high"
-        assert len(item.source_urls) == 1
-        assert len(item.tags) == 3
+        assert condor_item.content.startswith("IBM unveiled")
+        assert condor_item.confidence == "high"
+        assert len(condor_item.source_urls) == 1
+        assert len(condor_item.tags) == 3
 
         # Valid instance with minimal fields
         minimal_item = InformationItem(
@@ -173,16 +198,15 @@ class TestModels:
         assert len(minimal_item.source_urls) == 0  # Default empty list
         assert len(minimal_item.tags) == 0  # Default empty list
 
-        # Invalid confidence level
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param({"content": "Test content", "confidence": "super-high"},
+                     id="invalid-confidence"),
+        pytest.param({}, id="missing-content"),
+    ])
+    def test_information_item_invalid(self, kwargs):
+        """Test InformationItem rejection of invalid input."""
         with pytest.raises(ValidationError):
-            InformationItem(
-                content="Test content",
-                confidence="super-high"  # Invalid value
-            )
-
-        # Missing required content field
-        with pytest.raises(ValidationError):
-            InformationItem()
+            InformationItem(**kwargs)
 
     def test_information_group(self):
         """Test InformationGroup model."""
@@ -219,6 +243,28 @@ class TestModels:
         with pytest.raises(ValidationError):
             InformationGroup()
 
+    def test_information_group_from_raw(self):
+        """Test batch construction of InformationGroup from a raw dict."""
+        raw = {
+            "topic": "Quantum Hardware",
+            "consensus": [
+                {"content": "Superconducting qubits are widely used.", "confidence": "HIGH"}
+            ],
+            "gaps": ["Limited information on qubit stability."]
+        }
+
+        group = InformationGroup.from_raw(raw)
+        assert group == InformationGroup(**raw)
+        assert group.consensus[0].confidence == "high"
+        assert group.contradictions == []  # Missing key defaults to empty
+
+        # Element validation still runs on the batch path
+        with pytest.raises(ValidationError):
+            InformationGroup.from_raw({
+                "topic": "Quantum Hardware",
+                "consensus": [{"confidence": "high"}]  # Missing content
+            })
+
     def test_information_map(self):
         """Test InformationMap model."""
         # Valid instance
@@ -413,8 +459,7 @@ class TestModels:
             total_queries=12,
             completed_queries=6,
             current_query="quantum computing hardware IBM",
-            elapsed_seconds=120.5,
-            completion_percentage=50.0
+            elapsed_seconds=120.5
         )
         assert progress.total_depth == 3
         assert progress.current_depth == 2
@@ -424,6 +469,7 @@ class TestModels:
         assert progress.completed_queries == 6
         assert progress.current_query == "quantum computing hardware IBM"
         assert progress.elapsed_seconds == 120.5
+        # Derived from completed_queries / total_queries
         assert progress.completion_percentage == 50.0
 
         # Missing required fields
@@ -451,7 +497,8 @@ class TestModels:
         assert error.context == "During SERP query execution"
         assert error.impact == "Unable to retrieve search results for quantum computing query"
         assert error.resolution == "Retried with alternative search endpoint"
-        assert error.timestamp == "2024-03-10T12:34:56"
+        # ISO input is normalized to epoch milliseconds on construction
+        assert error.timestamp == int(datetime(2024, 3, 10, 12, 34, 56).timestamp() * 1000)
 
         # Valid instance with minimal fields
         minimal_error = ResearchError(
@@ -464,22 +511,19 @@ class TestModels:
         assert minimal_error.context == ""  # Default value
         assert minimal_error.impact == ""  # Default value
         assert minimal_error.resolution is None  # Default value
-        assert minimal_error.timestamp == "2024-03-10T12:00:00"
-
-        # Missing required fields
+        assert minimal_error.timestamp == int(datetime(2024, 3, 10, 12, 0, 0).timestamp() * 1000)
+
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param({"error_type": "API Error", "timestamp": "2024-03-10T12:00:00"},
+                     id="missing-error-message"),
+        pytest.param({"error_type": "API Error",
+                      "error_message": "Failed to connect to search API"},
+                     id="missing-timestamp"),
+    ])
+    def test_research_error_invalid(self, kwargs):
+        """Test ResearchError rejection of invalid input."""
         with pytest.raises(ValidationError):
-            ResearchError(
-                error_type="API Error",
-                # Missing error_message
-                timestamp="2024-03-10T12:00:00"
-            )
-
-        with pytest.raises(ValidationError):
-            ResearchError(
-                error_type="API Error",
-                error_message="Failed to connect to search API"
-                # Missing timestamp
-            )
+            ResearchError(**kwargs)
 
     def test_research_error_log(self):
         """Test ResearchErrorLog model."""
@@ -504,4 +548,38 @@ class TestModels:
 
         # Empty error list is valid
         empty_log = ResearchErrorLog()
-        assert len(empty_log.errors) == 0
\ No newline at end of file
+        assert len(empty_log.errors) == 0
+
+    def test_trusted_context_validation(self):
+        """Test reloading normalized dumps with the trusted context flag."""
+        evaluation = SourceEvaluation.model_validate({
+            "url": "https://research.ibm.com/blog/1000-qubit-processor",
+            "title": "IBM Quantum",
+            "credibility_rating": "HIGH",
+            "relevance_rating": "High",
+            "justification": "Official IBM research blog"
+        })
+        # Trusted reloads skip the normalization pass but must yield a model
+        # identical to the one the untrusted path produced
+        assert SourceEvaluation.model_validate(
+            evaluation.model_dump(), context={"trusted": True}
+        ) == evaluation
+
+        item = InformationItem.model_validate({
+            "content": "IBM's Condor processor has 1,121 qubits.",
+            "source_urls": ["https://research.ibm.com/blog/1000-qubit-processor"],
+            "confidence": "HIGH",
+            "tags": ["hardware"]
+        })
+        assert InformationItem.model_validate(
+            item.model_dump(), context={"trusted": True}
+        ) == item
+
+        error = ResearchError.model_validate({
+            "error_type": "API Error",
+            "error_message": "Failed to connect to search API",
+            "timestamp": "2024-03-10T12:34:56"
+        })
+        assert ResearchError.model_validate(
+            error.model_dump(), context={"trusted": True}
+        ) == error
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Tests for the text splitter utility.
+
+The expected chunk lists below are pinned against the original
+character-splitting implementation, so any behavioral drift in the
+span-based splitter shows up as an exact-output mismatch.
+"""
+
+import pytest
+
+from deep_research.utils.text_splitter import RecursiveCharacterTextSplitter
+
+_PARAGRAPHS = (
+    "Quantum computing hardware has advanced rapidly.\n\n"
+    "IBM unveiled the 1,121-qubit Condor processor in December 2023. "
+    "Google continues its quantum supremacy experiments with Sycamore.\n\n"
+    "Error correction remains the central challenge, with surface codes "
+    "showing the most promising results so far."
+)
+
+
+class TestRecursiveCharacterTextSplitter:
+    """Tests for the RecursiveCharacterTextSplitter class."""
+
+    def test_invalid_overlap(self):
+        """Test that chunk_overlap >= chunk_size is rejected."""
+        with pytest.raises(ValueError):
+            RecursiveCharacterTextSplitter(chunk_size=10, chunk_overlap=10)
+
+    def test_split_text_default_separators(self):
+        """Test splitting prose with the default separator cascade."""
+        splitter = RecursiveCharacterTextSplitter(chunk_size=100, chunk_overlap=20)
+
+        assert splitter.split_text(_PARAGRAPHS) == [
+            "Quantum computing hardware has advanced rapidly.",
+            "IBM unveiled the 1,121-qubit Condor processor in December 2023",
+            "Google continues its quantum supremacy experiments with Sycamore.",
+            "Error correction remains the central challenge",
+            "with surface codes showing the most promising results so far",
+        ]
+
+    def test_split_text_word_separator(self):
+        """Test splitting on spaces with overlapping chunks."""
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=15, chunk_overlap=5, separators=[" ", ""]
+        )
+
+        assert splitter.split_text("the quick brown fox jumps over the lazy dog") == [
+            "the quick brown",
+            "brown fox jumps",
+            "jumps over the",
+            "the lazy dog",
+        ]
+
+    def test_split_text_no_separator(self):
+        """Test the character-window path used when no separator matches."""
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=10, chunk_overlap=3, separators=[""]
+        )
+
+        assert splitter.split_text("abcdefghijklmnopqrstuvwxyz") == [
+            "abcdefghi",
+            "ghijklmno",
+            "mnopqrstu",
+            "stuvwxyz",
+        ]
+
+        # Text shorter than a window comes back as a single chunk
+        assert splitter.split_text("abc") == ["abc"]
+        assert splitter.split_text("") == []
+
+    def test_split_text_maximum_overlap(self):
+        """Test the chunk_overlap == chunk_size - 1 edge of the window path."""
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=5, chunk_overlap=4, separators=[""]
+        )
+
+        # The merge loop cannot evict below the overlap here, so after the
+        # initial window the chunks advance one character at a time
+        assert splitter.split_text("0123456789") == [
+            "0123", "01234", "12345", "23456", "34567", "45678", "56789",
+        ]
+
+    def test_merge_splits(self):
+        """Test merging pre-split parts into overlapping chunks."""
+        splitter = RecursiveCharacterTextSplitter(chunk_size=20, chunk_overlap=5)
+
+        merged = splitter.merge_splits(
+            ["alpha", "beta", "gamma", "delta", "epsilon"], " "
+        )
+        assert merged == ["alpha beta gamma delta", "delta epsilon"]
+
+        # Empty and whitespace-only parts never produce empty chunks
+        assert splitter.merge_splits([], " ") == []
+        assert splitter.merge_splits(["", "  "], " ") == []
+
+    def test_create_documents(self):
+        """Test batch splitting across multiple texts."""
+        splitter = RecursiveCharacterTextSplitter(chunk_size=100, chunk_overlap=20)
+        texts = [_PARAGRAPHS, "A short standalone document."]
+
+        documents = splitter.create_documents(texts)
+
+        # Batch output is the concatenation of the per-text splits
+        assert documents == (
+            splitter.split_text(texts[0]) + splitter.split_text(texts[1])
+        )
+        assert splitter.split_documents(texts) == documents